@@ -75,10 +75,18 @@ class TokenUsage:
 
 @dataclass
 class Message:
-    """A conversation message with typed content parts."""
+    """A conversation message with typed content parts.
+
+    Messages are treated as immutable once built (context pruning replaces
+    them rather than editing ``parts``), so ``to_openai_dict()`` caches its
+    result.
+    """
 
     role: Literal["system", "user", "assistant", "tool"]
     parts: list[ContentPart] = field(default_factory=list)
+    _openai_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def text(self) -> str:
@@ -160,7 +168,15 @@ class Message:
         ``thinking_blocks`` and ``reasoning_content`` so that litellm can
         round-trip them to Anthropic (required for multi-turn tool calling
         with extended thinking enabled).
+
+        The result is cached on the message and shared between calls, so
+        callers must not mutate it.
         """
+        if self._openai_dict is None:
+            self._openai_dict = self._build_openai_dict()
+        return self._openai_dict
+
+    def _build_openai_dict(self) -> dict[str, Any]:
         if self.role == "tool":
             # Tool results
             for p in self.parts:
@@ -24,6 +24,7 @@ Normalized chunk format (same as before):
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 from collections.abc import AsyncIterator
@@ -43,7 +44,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Configuration for an LLM provider."""
 
@@ -132,8 +133,13 @@ class LiteLLMProvider:
 
         response = await _acompletion_with_retry(**kwargs)
 
+        # Specialize normalization to the fields this request can produce.
+        # thinking_blocks are read for every provider: besides Claude,
+        # litellm emits them for Gemini/Vertex, carrying the thought
+        # signatures the next turn must send back.
+        normalize = functools.partial(_chunk_to_dict, tool_calls=bool(tools))
         async for chunk in response:  # type: ignore[union-attr]
-            yield _chunk_to_dict(chunk)
+            yield normalize(chunk)
 
 
 @retry(
@@ -150,19 +156,30 @@ async def _acompletion_with_retry(**kwargs: Any) -> CustomStreamWrapper | ModelR
     return await litellm.acompletion(**kwargs)
 
 
-def _chunk_to_dict(chunk: ModelResponseStream) -> dict[str, Any]:
+def _chunk_to_dict(
+    chunk: ModelResponseStream,
+    *,
+    tool_calls: bool = True,
+) -> dict[str, Any]:
     """Convert a litellm ModelResponseStream chunk to our normalized dict.
 
     litellm chunks have the same shape as OpenAI ChatCompletionChunk objects:
       chunk.id, chunk.object, chunk.choices[0].delta.{content, role, tool_calls},
       chunk.choices[0].finish_reason, chunk.usage
+
+    ``id``, ``object`` and ``choices`` are always present on
+    ``ModelResponseStream``, so they are read directly — a missing attribute
+    is a bug upstream and should surface as ``AttributeError``.
+
+    ``tool_calls`` can be turned off by callers that know the request sent
+    no tools, skipping that per-chunk lookup.
     """
     result: dict[str, Any] = {
-        "id": getattr(chunk, "id", ""),
-        "object": getattr(chunk, "object", "chat.completion.chunk"),
+        "id": chunk.id,
+        "object": chunk.object,
     }
 
-    choices = getattr(chunk, "choices", None)
+    choices = chunk.choices
     if choices:
         choice = choices[0]
         delta = choice.delta
@@ -180,11 +197,11 @@ def _chunk_to_dict(chunk: ModelResponseStream) -> dict[str, Any]:
         if reasoning is not None:
             result["delta"]["reasoning_content"] = reasoning
 
-        thinking_blocks = getattr(delta, "thinking_blocks", None)
-        if thinking_blocks:
-            result["delta"]["thinking_blocks"] = thinking_blocks
+        blocks = getattr(delta, "thinking_blocks", None)
+        if blocks:
+            result["delta"]["thinking_blocks"] = blocks
 
-        if delta.tool_calls:
+        if tool_calls and delta.tool_calls:
             result["delta"]["tool_calls"] = []
             for tc in delta.tool_calls:
                 tc_dict: dict[str, Any] = {
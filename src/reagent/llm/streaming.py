@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from typing import Any, Callable
@@ -33,9 +34,69 @@ OnToolCall = (
     Callable[[str, str, str], None] | None
 )  # (tool_call_id, tool_name, arguments)
 OnThinking = Callable[[str], None] | None  # (thinking_text_chunk)
+OnToolDone = Callable[[Message], None] | None  # (tool_result_message)
 
+# Upper bound on tool calls from one step that run at the same time.
+MAX_CONCURRENT_TOOLS = 8
 
-@dataclass
+# Streamed fragments are coalesced before reaching callbacks; a batch is
+# flushed once it holds this many chars or has been pending this long.
+_BATCH_MAX_CHARS = 128
+_BATCH_MAX_DELAY = 0.032  # seconds
+
+
+class _TextBatcher:
+    """Coalesce adjacent streamed text fragments into fewer callback calls.
+
+    Providers emit one delta per token, and every callback invocation can
+    trigger a UI redraw. Fragments are buffered and handed to ``emit`` as a
+    single string when the batch is large or old enough, or on ``flush()``.
+    Given a loop, a timer also flushes a batch that reaches
+    ``_BATCH_MAX_DELAY`` while the provider stalls between fragments.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[str], None],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self._emit = emit
+        self._loop = loop
+        self._parts: list[str] = []
+        self._size = 0
+        self._started = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    def add(self, text: str) -> bool:
+        """Buffer a fragment. Returns True if the batch was flushed."""
+        if not self._parts:
+            self._started = time.monotonic()
+            if self._loop is not None:
+                self._timer = self._loop.call_later(_BATCH_MAX_DELAY, self.flush)
+        self._parts.append(text)
+        self._size += len(text)
+        if (
+            self._size >= _BATCH_MAX_CHARS
+            or time.monotonic() - self._started >= _BATCH_MAX_DELAY
+        ):
+            return self.flush()
+        return False
+
+    def flush(self) -> bool:
+        """Emit any buffered text. Returns True if anything was emitted."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._parts:
+            return False
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._emit(text)
+        return True
+
+
+@dataclass(slots=True)
 class GenerateResult:
     """Result of a single LLM generation."""
 
@@ -52,7 +113,7 @@ class GenerateResult:
         return len(self.tool_calls) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a generate + tool dispatch step."""
 
@@ -95,6 +156,14 @@ async def generate(
     usage = TokenUsage()
     finish_reason = None
 
+    loop = asyncio.get_running_loop()
+    thinking_batcher = _TextBatcher(on_thinking, loop) if on_thinking else None
+    text_batcher = (
+        _TextBatcher(lambda text: on_part(TextPart(text=text)), loop)
+        if on_part
+        else None
+    )
+
     async for chunk in provider.stream(system, api_messages, tools):
         fr = chunk.get("finish_reason")
         if fr:
@@ -106,9 +175,11 @@ async def generate(
         reasoning = delta.get("reasoning_content")
         if reasoning:
             thinking_buffer += reasoning
-            if on_thinking:
-                on_thinking(reasoning)
-                await asyncio.sleep(0)
+            if thinking_batcher:
+                if text_batcher:
+                    text_batcher.flush()
+                if thinking_batcher.add(reasoning):
+                    await asyncio.sleep(0)
 
         # Thinking blocks (Anthropic format — extract signature)
         tb = delta.get("thinking_blocks")
@@ -121,24 +192,34 @@ async def generate(
                     thinking_text = block.get("thinking", "")
                     if thinking_text and thinking_text not in thinking_buffer:
                         thinking_buffer += thinking_text
-                        if on_thinking:
-                            on_thinking(thinking_text)
-                            await asyncio.sleep(0)
+                        if thinking_batcher:
+                            if text_batcher:
+                                text_batcher.flush()
+                            if thinking_batcher.add(thinking_text):
+                                await asyncio.sleep(0)
 
         # Text content
         content = delta.get("content")
         if content:
             text_buffer += content
-            if on_part:
-                on_part(TextPart(text=content))
-                # Yield control so TUI/listeners can process the event.
-                # Without this, the tight async-for loop starves other
-                # coroutines on the event loop and text only appears at
-                # the end.
-                await asyncio.sleep(0)
+            if text_batcher:
+                # Keep thinking ahead of text in the callback stream.
+                if thinking_batcher:
+                    thinking_batcher.flush()
+                if text_batcher.add(content):
+                    # Yield control so TUI/listeners can process the event.
+                    # Without this, the tight async-for loop starves other
+                    # coroutines on the event loop and text only appears at
+                    # the end.
+                    await asyncio.sleep(0)
 
         # Tool calls (streamed incrementally)
         tc_deltas = delta.get("tool_calls", [])
+        if tc_deltas:
+            if thinking_batcher:
+                thinking_batcher.flush()
+            if text_batcher:
+                text_batcher.flush()
         for tc_delta in tc_deltas:
             idx = tc_delta.get("index", 0)
             if idx not in tool_call_buffers:
@@ -167,6 +248,11 @@ async def generate(
                 total_tokens=u.get("total_tokens", 0),
             )
 
+    if thinking_batcher:
+        thinking_batcher.flush()
+    if text_batcher:
+        text_batcher.flush()
+
     # Build the final message
     parts: list[ContentPart] = []
 
@@ -210,6 +296,8 @@ async def step(
     on_tool_call: OnToolCall = None,
     on_tool_result: OnToolResult = None,
     on_thinking: OnThinking = None,
+    on_tool_done: OnToolDone = None,
+    max_concurrent_tools: int = MAX_CONCURRENT_TOOLS,
 ) -> StepResult:
     """Generate one LLM response and dispatch tool calls.
 
@@ -228,6 +316,9 @@ async def step(
         on_tool_call: Callback when a tool call is received (id, name, arguments).
         on_tool_result: Callback for tool results (tool_call_id, tool_name, content, is_error).
         on_thinking: Callback for streaming thinking/reasoning text chunks.
+        on_tool_done: Callback with each tool result message as soon as that
+            tool finishes, in completion order.
+        max_concurrent_tools: Maximum number of tool calls running at once.
     """
     result = await generate(
         provider, system, messages, tools, on_part, on_tool_call, on_thinking
@@ -236,23 +327,40 @@ async def step(
     tool_results: list[Message] = []
 
     if result.has_tool_calls and tool_dispatch:
-        # Dispatch tool calls concurrently
-        async def _run_tool(tc: ToolCall) -> Message:
-            try:
-                content, is_error = await tool_dispatch(tc)
-                content = str(content)
-            except Exception as e:
-                logger.error("Tool %s failed: %s", tc.name, e)
-                content = f"Error: {e}"
-                is_error = True
+        # Dispatch tool calls concurrently, bounded by a semaphore
+        semaphore = asyncio.Semaphore(max_concurrent_tools)
+
+        async def _run_tool(idx: int, tc: ToolCall) -> tuple[int, Message]:
+            async with semaphore:
+                try:
+                    content, is_error = await tool_dispatch(tc)
+                    content = str(content)
+                except Exception as e:
+                    logger.error("Tool %s failed: %s", tc.name, e)
+                    content = f"Error: {e}"
+                    is_error = True
 
             if on_tool_result:
                 on_tool_result(tc.id, tc.name, content, is_error)
 
-            return Message.tool_result(tc.id, content, is_error)
-
-        tasks = [_run_tool(tc) for tc in result.tool_calls]
-        tool_results = await asyncio.gather(*tasks)
+            return idx, Message.tool_result(tc.id, content, is_error)
+
+        tasks = [
+            asyncio.ensure_future(_run_tool(i, tc))
+            for i, tc in enumerate(result.tool_calls)
+        ]
+        # Results are reported as they complete but returned in call order.
+        ordered: list[Message | None] = [None] * len(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                idx, msg = await next_done
+                ordered[idx] = msg
+                if on_tool_done:
+                    on_tool_done(msg)
+        finally:
+            for task in tasks:
+                task.cancel()
+        tool_results = [msg for msg in ordered if msg is not None]
 
     return StepResult(
         message=result.message,
@@ -9,7 +9,7 @@ from typing import Any
 from reagent.model.hypothesis import Observation, Hypothesis, Finding
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetInfo:
     """Basic information about the analysis target."""
 
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import secrets
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
 
 def _gen_id() -> str:
-    return uuid.uuid4().hex[:8]
+    # 32 random bits: ~1 collision expected per 65k ids, ample for one session.
+    return secrets.token_hex(4)
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Raw data observed during analysis.
 
@@ -28,7 +29,7 @@ class Observation:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """An interpretive claim about the binary.
 
@@ -64,7 +65,7 @@ class Hypothesis:
         self.reject_reason = reason
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A verified, confirmed fact about the binary.
 
@@ -3,8 +3,222 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
+import re
 import threading
-from collections import deque
+from array import array
+from collections.abc import Iterable, Iterator
+
+# Pattern syntax that can match (or anchor on) a line break.  Patterns free
+# of these can be run over the newline-joined buffer in one pass and still
+# give the same per-line results.
+_NEWLINE_SENSITIVE_RE = re.compile(
+    r"\\[nAZsDW]|\\x0[aA]|\\0?12|\\u000[aA]|\\N|\^|\$|\[\^|\n|\(\?[a-zA-Z-]*s"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern, reusing the result for repeated patterns."""
+    return re.compile(pattern)
+
+
+def _single_line_only(compiled: re.Pattern[str]) -> bool:
+    """Return True if ``compiled`` can never match across a line break."""
+    return not (
+        compiled.flags & re.DOTALL or _NEWLINE_SENSITIVE_RE.search(compiled.pattern)
+    )
+
+
+def _search_lines(
+    compiled: re.Pattern[str], lines: list[str], limit: int
+) -> list[tuple[int, str]]:
+    """Search ``lines`` one at a time.
+
+    The bound ``compiled.search`` is mapped over the lines and ``compress``
+    keeps the matching ``(index, line)`` pairs, so the scan runs in C and
+    stops lazily once ``limit`` matches are found.
+    """
+    matches = itertools.compress(enumerate(lines), map(compiled.search, lines))
+    return list(itertools.islice(matches, limit))
+
+
+def _search_text(
+    compiled: re.Pattern[str], text: str, limit: int
+) -> list[tuple[int, str]] | None:
+    """Search newline-joined ``text`` with one C-level scan.
+
+    Line numbers come from counting newlines between successive matches, so
+    only matching lines are ever sliced out.  Returns None if a match
+    crossed a line break, in which case the caller must fall back to
+    ``_search_lines``.
+    """
+    search = compiled.search
+    results: list[tuple[int, str]] = []
+    pos = line_no = 0
+    while len(results) < limit and pos <= len(text):
+        m = search(text, pos)
+        if m is None:
+            break
+        if "\n" in m.group():
+            return None
+        start = m.start()
+        line_no += text.count("\n", pos, start)
+        line_start = max(text.rfind("\n", pos, start) + 1, pos)
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        results.append((line_no, text[line_start:line_end]))
+        pos = line_end + 1  # resume at the next line
+        line_no += 1
+    return results
+
+
+# Lines are stored UTF-8 encoded; surrogatepass lets any str round-trip.
+_ENCODING = "utf-8"
+_ERRORS = "surrogatepass"
+
+
+class _LineLog:
+    """One track of the buffer: lines stored back to back in a flat log.
+
+    Each line is encoded into a single ``bytearray`` followed by ``\\n``.
+    ``_sums[i]`` is the number of content bytes (newlines excluded) before
+    line ``_lo + i``, so line ``k`` starts at absolute byte ``S(k) + k``;
+    one machine int per line is the whole index.  Evicting the oldest lines
+    only advances ``_first``, and the dead prefix of both the log and the
+    index is cut off once it outgrows the live part.
+    """
+
+    __slots__ = (
+        "_log",
+        "_sums",
+        "_first",
+        "_lo",
+        "_base",
+        "_len",
+        "_max_lines",
+        "_ragged",
+    )
+
+    def __init__(self, max_lines: int) -> None:
+        self._max_lines = max_lines
+        self.clear()
+
+    def clear(self) -> None:
+        self._log = bytearray()
+        self._sums = array("q", (0,))
+        self._first = 0  # index in _sums of the first live line
+        self._lo = 0  # line number of _sums[0]
+        self._base = 0  # absolute byte offset of _log[0]
+        self._len = 0  # live lines
+        self._ragged = False  # some line contains a newline of its own
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def ragged(self) -> bool:
+        return self._ragged
+
+    def _start(self, i: int) -> int:
+        """Absolute byte offset where the line at ``_sums`` index ``i`` starts."""
+        return self._sums[i] + self._lo + i
+
+    def _end(self, i: int) -> int:
+        """Absolute byte offset of the newline ending that line."""
+        return self._sums[i + 1] + self._lo + i
+
+    def append(self, line: str) -> None:
+        data = line.encode(_ENCODING, _ERRORS)
+        if b"\n" in data:
+            self._ragged = True
+        self._log += data
+        self._log.append(0x0A)
+        self._sums.append(self._sums[-1] + len(data))
+        self._evict()
+
+    def extend_encoded(self, data: bytes, lengths: Iterable[int]) -> None:
+        """Append encoded ``\\n``-separated lines, given their byte lengths."""
+        sums = itertools.accumulate(lengths, initial=self._sums[-1])
+        self._sums.extend(itertools.islice(sums, 1, None))
+        self._log += data
+        self._log.append(0x0A)
+        self._evict()
+
+    def _evict(self) -> None:
+        live = len(self._sums) - 1 - self._first
+        if live > self._max_lines:
+            self._first += live - self._max_lines
+            live = self._max_lines
+        self._len = live
+        if self._first > live:
+            head = self._start(self._first)
+            del self._log[: head - self._base]
+            del self._sums[: self._first]
+            self._base = head
+            self._lo += self._first
+            self._first = 0
+
+    def window(self, offset: int, limit: int) -> list[str]:
+        """Decode lines ``[offset, offset + limit)``."""
+        n = len(self)
+        start = min(max(offset, 0), n)
+        stop = min(start + max(limit, 0), n)
+        if start >= stop:
+            return []
+        first = self._first
+        if self._ragged:
+            # Lines may hold newlines, so cut each one out by its offsets.
+            return [
+                self._decode(self._start(i), self._end(i))
+                for i in range(first + start, first + stop)
+            ]
+        text = self._decode(self._start(first + start), self._end(first + stop - 1))
+        return text.split("\n")
+
+    def window_text(self, offset: int, limit: int) -> str:
+        """Lines ``[offset, offset + limit)`` joined by ``\\n``, in one decode.
+
+        Lines sit in the log separated by single newline bytes, so the byte
+        span of a range already is its joined text, ragged or not.
+        """
+        n = len(self)
+        start = min(max(offset, 0), n)
+        stop = min(start + max(limit, 0), n)
+        if start >= stop:
+            return ""
+        first = self._first
+        return self._decode(self._start(first + start), self._end(first + stop - 1))
+
+    def text(self) -> str:
+        """Decode every live line, joined by ``\\n``."""
+        if not len(self):
+            return ""
+        return self._decode(self._start(self._first), self._end(len(self._sums) - 2))
+
+    def _decode(self, start: int, end: int) -> str:
+        base = self._base
+        return self._log[start - base : end - base].decode(_ENCODING, _ERRORS)
+
+    def snapshot(self, offset: int) -> tuple[bytes, array[int]]:
+        """Copy lines ``[offset, end)`` out as raw bytes plus their sums.
+
+        Both copies are single memcpys; ``_iter_lines`` decodes from them.
+        """
+        start = self._first + min(max(offset, 0), len(self))
+        stop = len(self._sums) - 1
+        base = self._base
+        data = bytes(self._log[self._start(start) - base : self._start(stop) - base])
+        return data, self._sums[start : stop + 1]
+
+
+def _iter_lines(data: bytes, sums: array[int]) -> Iterator[str]:
+    """Decode the lines of a ``_LineLog.snapshot`` one at a time."""
+    s0 = sums[0]
+    for j in range(len(sums) - 1):
+        yield data[sums[j] - s0 + j : sums[j + 1] - s0 + j].decode(_ENCODING, _ERRORS)
 
 
 class RollingBuffer:
@@ -17,19 +231,37 @@ class RollingBuffer:
     * **raw** (``_raw_lines``) — original terminal output preserving
       ANSI escape sequences, suitable for xterm.js-style rendering.
 
+    Each track is a ``_LineLog``: one contiguous ``bytearray`` plus an
+    ``array`` offset index, rather than one ``str`` object per line.
+
     An ``asyncio.Event`` is set whenever new data arrives, allowing
     consumers to ``await`` instead of polling.  Call ``attach_loop()``
     once from the asyncio thread to enable this.
+
+    Writes and reads that touch a log hold the lock, since appending may
+    compact it.  ``line_count`` and ``total_lines`` are a single ``len()``
+    or int read, which the GIL makes atomic, so they skip the lock.
     """
 
     def __init__(self, max_lines: int = 50_000) -> None:
-        self._lines: deque[str] = deque(maxlen=max_lines)
-        self._raw_lines: deque[str] = deque(maxlen=max_lines)
+        self._lines = _LineLog(max_lines)
+        self._raw_lines = _LineLog(max_lines)
         self._total_lines: int = 0  # Total lines ever added
+        # Mirrors len(self._lines) so the hot line_count poll is a plain read
+        self._line_count: int = 0
+        # Bumped on every change; lets waiters tell "changed since I looked"
+        # without relying on the event's set/clear state.
+        self._version: int = 0
+        # (version, text) of the last read_all() / read_all_raw() result
+        self._all_cache: tuple[int, str] | None = None
+        self._all_raw_cache: tuple[int, str] | None = None
         self._lock = threading.Lock()
         # Event-based notification (set after attach_loop)
         self._data_event: asyncio.Event | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        # True while a cross-thread wakeup is queued but has not run yet
+        self._wakeup_pending = False
 
     def attach_loop(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
         """Attach an asyncio event loop so append() can signal waiters.
@@ -38,8 +270,32 @@ class RollingBuffer:
         After this, ``wait_for_data()`` becomes usable.
         """
         self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
         self._data_event = asyncio.Event()
 
+    def _notify(self) -> None:
+        """Wake ``wait_for_data()`` waiters.
+
+        Sets the event directly when called on the loop thread, and only
+        pays for the cross-thread ``call_soon_threadsafe`` wakeup otherwise.
+        Nothing is scheduled if the event is already set or a wakeup is
+        already queued, so a burst of chunks costs one loop round-trip.
+        """
+        event = self._data_event
+        if event is None or self._loop is None or event.is_set():
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            event.set()
+        elif not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        """Loop-thread half of a cross-thread wakeup."""
+        self._wakeup_pending = False
+        if self._data_event is not None:
+            self._data_event.set()
+
     def append(self, line: str, raw_line: str | None = None) -> None:
         """Append a line to the buffer.
 
@@ -52,9 +308,9 @@ class RollingBuffer:
             self._lines.append(line)
             self._raw_lines.append(raw_line if raw_line is not None else line)
             self._total_lines += 1
-        # Signal waiters (thread-safe)
-        if self._data_event is not None and self._loop is not None:
-            self._loop.call_soon_threadsafe(self._data_event.set)
+            self._line_count = len(self._lines)
+            self._version += 1
+        self._notify()
 
     def append_text(self, text: str, raw_text: str | None = None) -> None:
         """Append text, splitting into lines.
@@ -64,33 +320,58 @@ class RollingBuffer:
             raw_text: Original text with ANSI preserved.
                       Defaults to ``text`` if not provided.
         """
-        cleaned_lines = text.split("\n")
-        raw_lines = (raw_text or text).split("\n")
-        # Ensure same number of lines (pad raw if needed)
-        while len(raw_lines) < len(cleaned_lines):
-            raw_lines.append("")
+        raw = raw_text or text
+        data = text.encode(_ENCODING, _ERRORS)
+        lengths = list(map(len, data.split(b"\n")))
+        n = len(lengths)
+        if raw is text:
+            # Nothing was stripped (the usual TERM=dumb case): both tracks
+            # get the same bytes, encoded and measured once.
+            raw_data, raw_lengths = data, lengths
+        else:
+            # Keep both tracks the same length (pad or trim raw)
+            raw_n = raw.count("\n") + 1
+            if raw_n < n:
+                raw += "\n" * (n - raw_n)
+            elif raw_n > n:
+                raw = "\n".join(raw.split("\n", n)[:n])
+            raw_data = raw.encode(_ENCODING, _ERRORS)
+            raw_lengths = list(map(len, raw_data.split(b"\n")))
         with self._lock:
-            for cl, rl in zip(cleaned_lines, raw_lines):
-                self._lines.append(cl)
-                self._raw_lines.append(rl)
-                self._total_lines += 1
+            self._lines.extend_encoded(data, lengths)
+            self._raw_lines.extend_encoded(raw_data, raw_lengths)
+            self._total_lines += n
+            self._line_count = len(self._lines)
+            self._version += 1
         # Signal once after batch
-        if self._data_event is not None and self._loop is not None:
-            self._loop.call_soon_threadsafe(self._data_event.set)
+        self._notify()
 
-    async def wait_for_data(self, timeout: float | None = None) -> bool:
+    async def wait_for_data(
+        self, timeout: float | None = None, since: int | None = None
+    ) -> bool:
         """Wait until new data is appended (or timeout).
 
         Returns True if data arrived, False on timeout.
         Resets the event so the next call blocks again.
+
+        Pass ``since`` (a ``version`` read before inspecting the buffer) to
+        return at once if anything changed after that read; no wakeup that
+        lands between the caller's check and this wait is lost.
         """
-        if self._data_event is None:
+        event = self._data_event
+        if event is None:
             # Fallback: no loop attached, just sleep briefly
             await asyncio.sleep(0.05)
             return True
+        if since is not None:
+            # Clear before comparing: a later append sees the event unset
+            # and sets it again, an earlier one shows up in the version.
+            event.clear()
+            if self._version != since:
+                return True
         try:
-            await asyncio.wait_for(self._data_event.wait(), timeout=timeout)
-            self._data_event.clear()
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            event.clear()
             return True
         except asyncio.TimeoutError:
             return False
@@ -106,10 +387,23 @@ class RollingBuffer:
             List of cleaned lines.
         """
         with self._lock:
-            lines = list(self._lines)
-        start = min(offset, len(lines))
-        end = min(start + limit, len(lines))
-        return lines[start:end]
+            return self._lines.window(offset, limit)
+
+    def read_text(self, offset: int = 0, limit: int = 500) -> str:
+        """Like ``"\\n".join(read(offset, limit))``, without the list."""
+        with self._lock:
+            return self._lines.window_text(offset, limit)
+
+    def iter_from(self, offset: int) -> Iterator[str]:
+        """Lazily iterate cleaned lines from ``offset`` to the current end.
+
+        The lines are copied out under the lock as one block of bytes and
+        each is decoded only when reached, so a scan that stops at its
+        first match neither builds a list nor decodes the rest.
+        """
+        with self._lock:
+            data, sums = self._lines.snapshot(offset)
+        return _iter_lines(data, sums)
 
     def read_raw(self, offset: int = 0, limit: int = 500) -> list[str]:
         """Read raw lines (with ANSI codes preserved) from the buffer.
@@ -122,65 +416,89 @@ class RollingBuffer:
             List of raw lines.
         """
         with self._lock:
-            lines = list(self._raw_lines)
-        start = min(offset, len(lines))
-        end = min(start + limit, len(lines))
-        return lines[start:end]
+            return self._raw_lines.window(offset, limit)
 
     def read_all(self) -> str:
-        """Read all buffered cleaned content as a single string."""
+        """Read all buffered cleaned content as a single string.
+
+        The result is cached until the buffer next changes, so repeated
+        polls of an idle session do not decode the whole log again.
+        """
         with self._lock:
-            return "\n".join(self._lines)
+            return self._cleaned_text()
+
+    def _cleaned_text(self) -> str:
+        """Cleaned text, from the cache if still current.  Hold the lock."""
+        cache = self._all_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        text = self._lines.text()
+        self._all_cache = (self._version, text)
+        return text
 
     def read_all_raw(self) -> str:
-        """Read all buffered raw content as a single string."""
+        """Read all buffered raw content as a single string.
+
+        Cached like ``read_all()``.
+        """
         with self._lock:
-            return "\n".join(self._raw_lines)
+            cache = self._all_raw_cache
+            if cache is not None and cache[0] == self._version:
+                return cache[1]
+            text = self._raw_lines.text()
+            self._all_raw_cache = (self._version, text)
+            return text
 
     def read_tail(self, n: int = 100) -> list[str]:
         """Read the last N cleaned lines."""
         with self._lock:
-            lines = list(self._lines)
-        return lines[-n:] if len(lines) > n else lines
+            return self._lines.window(len(self._lines) - n, n)
 
     def read_tail_raw(self, n: int = 100) -> list[str]:
         """Read the last N raw lines (ANSI preserved)."""
         with self._lock:
-            lines = list(self._raw_lines)
-        return lines[-n:] if len(lines) > n else lines
+            return self._raw_lines.window(len(self._raw_lines) - n, n)
 
     def search(self, pattern: str, limit: int = 50) -> list[tuple[int, str]]:
         """Search for lines matching a regex pattern.
 
         Returns list of (line_number, line_text) tuples.
         """
-        import re
-
         try:
-            compiled = re.compile(pattern)
+            compiled = _compile(pattern)
         except re.error:
             return []
 
-        results = []
         with self._lock:
-            for i, line in enumerate(self._lines):
-                if compiled.search(line):
-                    results.append((i, line))
-                    if len(results) >= limit:
-                        break
-        return results
+            if not len(self._lines):
+                return []
+            text = self._cleaned_text()
+            ragged = self._lines.ragged
+            lines = self._lines.window(0, len(self._lines)) if ragged else None
+
+        if lines is None and _single_line_only(compiled):
+            results = _search_text(compiled, text, limit)
+            if results is not None:
+                return results
+        return _search_lines(compiled, lines or text.split("\n"), limit)
 
     @property
     def line_count(self) -> int:
-        """Current number of lines in the buffer."""
-        with self._lock:
-            return len(self._lines)
+        """Current number of lines in the buffer.
+
+        Lockless: a single attribute read, polled by every wait loop.
+        """
+        return self._line_count
 
     @property
     def total_lines(self) -> int:
-        """Total number of lines ever added."""
-        with self._lock:
-            return self._total_lines
+        """Total number of lines ever added (lockless, like ``line_count``)."""
+        return self._total_lines
+
+    @property
+    def version(self) -> int:
+        """Change counter, bumped by every append and clear (lockless)."""
+        return self._version
 
     def clear(self) -> None:
         """Clear the buffer."""
@@ -188,3 +506,5 @@ class RollingBuffer:
             self._lines.clear()
             self._raw_lines.clear()
             self._total_lines = 0
+            self._line_count = 0
+            self._version += 1
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from typing import Any, Callable, TYPE_CHECKING
 
 from reagent.pty.session import PTYSession
@@ -27,6 +28,8 @@ class PTYManager:
 
     def __init__(self, wire: Wire | None = None) -> None:
         self._sessions: dict[str, PTYSession] = {}
+        # Session IDs in spawn order, for oldest-first eviction
+        self._order: deque[str] = deque()
         self._wire = wire
 
     async def spawn(
@@ -49,7 +52,7 @@ class PTYManager:
         """
         if len(self._sessions) >= self.MAX_SESSIONS:
             # Kill the oldest session
-            oldest = next(iter(self._sessions))
+            oldest = self._order[0]
             logger.warning("Max sessions reached, killing oldest: %s", oldest)
             await self.kill(oldest)
 
@@ -73,6 +76,7 @@ class PTYManager:
 
         await session.start()
         self._sessions[session.id] = session
+        self._order.append(session.id)
         return session
 
     def get(self, session_id: str) -> PTYSession | None:
@@ -83,7 +87,8 @@ class PTYManager:
         """Kill a session and remove it from tracking."""
         session = self._sessions.pop(session_id, None)
         if session:
-            session.kill()
+            self._order.remove(session_id)
+            await session.aclose()
 
     def list_sessions(self) -> list[dict[str, Any]]:
         """List all active sessions."""
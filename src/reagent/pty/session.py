@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 import logging
 import os
 import pty
 import re
+import secrets
 import signal
-import subprocess
-import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
@@ -19,6 +19,76 @@ from reagent.tool.truncation import strip_ansi, sanitize_binary_output
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per os.read() on the PTY master.
+_READ_SIZE = 64 * 1024
+# Upper bound on bytes drained per readiness callback, so a flooding process
+# cannot starve the event loop. Only then is a partial line held back.
+_MAX_DRAIN = 256 * 1024
+
+# Seconds to wait, after PTY EOF, for the child to be reaped before its
+# exit is reported without a code.
+_EXIT_REAP_TIMEOUT = 5.0
+
+# Most iovecs handed to one writev(); Linux's IOV_MAX.
+_MAX_IOV = 1024
+
+# One literal character of a regex: a non-metacharacter, or an escaped
+# punctuation character such as ``\(``.
+_LITERAL_CHAR_RE = re.compile(r"[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9]")
+# An unescaped ``|`` anywhere makes a leading literal optional.
+_ALTERNATION_RE = re.compile(r"(?<!\\)(?:\\\\)*\|")
+
+
+def _line_iov(payload: bytes) -> list[bytes]:
+    """Iovecs for one line of input: ``payload`` plus a newline if missing."""
+    return [payload] if payload.endswith(b"\n") else [payload, b"\n"]
+
+
+@functools.lru_cache(maxsize=1)
+def _base_env() -> dict[str, str]:
+    """Parent environment adjusted for PTY children, built once per process.
+
+    Not copied per spawn: the subprocess machinery only reads it.
+    """
+    env = dict(os.environ)
+    env["TERM"] = "dumb"  # Minimize ANSI escape sequences
+    env.pop("PROMPT_COMMAND", None)
+    return env
+
+
+@functools.lru_cache(maxsize=256)
+def _line_matcher(pattern: str, flags: int = 0) -> Callable[[str], object]:
+    """Build a per-line test for ``pattern`` that avoids the regex engine.
+
+    Prompt patterns are mostly a literal followed by a little regex, like
+    the gdb prompt followed by optional trailing whitespace.  The leading
+    literal must occur in every match, so a plain substring check rejects
+    most lines before ``search`` runs; a pattern that is entirely literal
+    never touches the regex at all.
+
+    Results are cached per ``(pattern, flags)``, so a prompt pattern used
+    for every command is parsed once.
+    """
+    compiled = re.compile(pattern, flags)
+    if flags & (re.IGNORECASE | re.VERBOSE):
+        # Literal characters no longer mean themselves
+        return compiled.search
+    chars: list[str] = []
+    pos = 0
+    while m := _LITERAL_CHAR_RE.match(pattern, pos):
+        chars.append(m.group()[-1])
+        pos = m.end()
+    if pos == len(pattern):
+        needle = "".join(chars)
+        return lambda line: needle in line
+    if chars and pattern[pos] in "*?{":
+        chars.pop()  # quantified, so not required
+    if not chars or _ALTERNATION_RE.search(pattern):
+        return compiled.search
+    prefix = "".join(chars)
+    search = compiled.search
+    return lambda line: prefix in line and search(line)
+
 
 class PTYStatus(enum.Enum):
     """Lifecycle states for a PTY session."""
@@ -41,11 +111,13 @@ class PTYSession:
     - Timeout support
     - Exit notification callback
 
-    Uses subprocess.Popen (not os.fork) to avoid deadlocks when
-    spawned from within an asyncio event loop on macOS.
+    Uses asyncio.create_subprocess_exec (Popen under the hood, not os.fork)
+    to avoid deadlocks when spawned from within an asyncio event loop on
+    macOS, and so exit is reported by the loop's child watcher rather than
+    by polling.
     """
 
-    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
     command: list[str] = field(default_factory=list)
     cwd: str = field(default_factory=os.getcwd)
     env: dict[str, str] = field(default_factory=dict)
@@ -54,10 +126,22 @@ class PTYSession:
     # Internal state
     buffer: RollingBuffer = field(default_factory=RollingBuffer)
     _master_fd: int = field(default=-1, init=False)
-    _proc: subprocess.Popen | None = field(default=None, init=False)
+    _proc: asyncio.subprocess.Process | None = field(default=None, init=False)
     _pid: int = field(default=0, init=False)
     _pgid: int = field(default=0, init=False)
-    _reader_task: asyncio.Task | None = field(default=None, init=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, init=False)
+    _read_tail: bytes = field(default=b"", init=False)
+    # Reports an exit seen as PTY EOF once the child is reaped
+    _exit_task: asyncio.Task[None] | None = field(default=None, init=False)
+    # Whether the last ingested output ended with a newline, i.e. the next
+    # drain starts a fresh line rather than finishing a partial one
+    _at_line_start: bool = field(default=True, init=False)
+    # Input queued this loop tick: (iovecs, future set once written)
+    _write_batch: tuple[list[bytes], asyncio.Future[None]] | None = field(
+        default=None, init=False
+    )
+    _write_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _flush_tasks: set[asyncio.Task[None]] = field(default_factory=set, init=False)
     _status: PTYStatus = field(default=PTYStatus.RUNNING, init=False)
     _on_exit: Callable[[PTYSession, int | None], None] | None = field(
         default=None, init=False
@@ -67,8 +151,8 @@ class PTYSession:
         """Set a callback to be invoked when the process exits unexpectedly.
 
         The callback receives (session, exit_code). It is called from the
-        reader task when the process dies on its own — NOT when killed via
-        kill().
+        event loop once a process that died on its own has been reaped —
+        NOT when killed via kill().
         """
         self._on_exit = callback
 
@@ -79,15 +163,17 @@ class PTYSession:
         self._master_fd = master_fd
 
         # Build environment
-        env = {**os.environ, **self.env}
-        env["TERM"] = "dumb"  # Minimize ANSI escape sequences
-        env.pop("PROMPT_COMMAND", None)
+        env = _base_env()
+        if self.env:
+            env = {**env, **self.env}
+            env["TERM"] = "dumb"
+            env.pop("PROMPT_COMMAND", None)
 
         try:
-            # Use subprocess.Popen instead of os.fork to avoid
-            # deadlocks in asyncio contexts (especially on macOS)
-            self._proc = subprocess.Popen(
-                self.command,
+            # Popen-based spawn (not os.fork) avoids deadlocks in asyncio
+            # contexts (especially on macOS)
+            self._proc = await asyncio.create_subprocess_exec(
+                *self.command,
                 stdin=slave_fd,
                 stdout=slave_fd,
                 stderr=slave_fd,
@@ -95,19 +181,29 @@ class PTYSession:
                 env=env,
                 cwd=self.cwd,
             )
+        except BaseException:
+            # No child will ever read the PTY; don't leak the master end
+            os.close(master_fd)
+            self._master_fd = -1
+            raise
         finally:
             # Parent always closes slave fd
             os.close(slave_fd)
 
         self._pid = self._proc.pid
-        self._pgid = os.getpgid(self._pid)
+        # start_new_session makes the child a session and group leader, so
+        # its pgid is its pid; no getpgid() round-trip (which would also
+        # raise if the child had already exited and been reaped).
+        self._pgid = self._pid
         self._status = PTYStatus.RUNNING
 
         # Attach the asyncio event loop to the buffer for event-based notification
-        self.buffer.attach_loop(asyncio.get_running_loop())
+        self._loop = asyncio.get_running_loop()
+        self.buffer.attach_loop(self._loop)
 
-        # Start async reader
-        self._reader_task = asyncio.create_task(self._read_loop())
+        # Read directly from the event loop whenever the master fd is readable
+        os.set_blocking(master_fd, False)
+        self._loop.add_reader(master_fd, self._on_readable)
 
         logger.info(
             "PTY session %s started: pid=%d pgid=%d cmd=%s",
@@ -117,40 +213,107 @@ class PTYSession:
             " ".join(self.command),
         )
 
-    async def _read_loop(self) -> None:
-        """Continuously read output from the PTY master fd."""
-        loop = asyncio.get_running_loop()
+    def _on_readable(self) -> None:
+        """Drain the PTY master fd; called by the event loop when readable.
+
+        Everything currently available is read and processed as one block,
+        so a line (or UTF-8 sequence) split across reads stays intact. A
+        final newline terminates the last line rather than adding an empty
+        one; a drain that opens with the newline ending the previous drain's
+        partial line likewise adds nothing for it, while a newline after a
+        complete line is a blank line and is kept. Only if the drain hits
+        ``_MAX_DRAIN`` is a trailing partial line held back for the next
+        callback, which is scheduled right away.
+        """
+        if self._loop is None:
+            return  # reader removed (EOF or kill) since this was scheduled
+        chunks = [self._read_tail] if self._read_tail else []
+        size = len(self._read_tail)
+        self._read_tail = b""
+        eof = False
+        while size < _MAX_DRAIN:
+            try:
+                data = os.read(self._master_fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:  # EIO once the slave side is closed
+                eof = True
+                break
+            if not data:
+                eof = True
+                break
+            chunks.append(data)
+            size += len(data)
+
+        data = b"".join(chunks)
+        if not self._at_line_start and data.startswith(b"\n"):
+            # Ends the partial line the previous drain already buffered
+            data = data[1:]
+            self._at_line_start = True
+        if data:
+            if size >= _MAX_DRAIN and not eof:
+                last_nl = data.rfind(b"\n")
+                if last_nl != -1:
+                    data, self._read_tail = data[: last_nl + 1], data[last_nl + 1 :]
+                    # The fd may already be empty, so no readable event
+                    # would deliver the tail (often the prompt): drain again
+                    # on the next loop iteration.
+                    if self._read_tail and self._loop is not None:
+                        self._loop.call_soon(self._on_readable)
+            self._at_line_start = data.endswith(b"\n")
+            self._ingest(data[:-1] if self._at_line_start else data)
+
+        if eof:
+            self._on_eof()
+
+    def _on_eof(self) -> None:
+        """Stop reading and record that the process went away on its own.
+
+        The child watcher usually has not reaped the process yet when the
+        PTY hits EOF, so the exit is reported from a task that waits for
+        the exit code first.
+        """
+        loop = self._loop
+        self._remove_reader()
+        if self._status == PTYStatus.RUNNING and loop is not None:
+            self._exit_task = loop.create_task(self._report_exit())
+
+    async def _report_exit(self) -> None:
+        """Reap the exited child, mark the session EXITED and fire on_exit."""
+        exit_code: int | None = None
+        if self._proc is not None:
+            try:
+                exit_code = await asyncio.wait_for(
+                    self._proc.wait(), timeout=_EXIT_REAP_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                pass  # closed its PTY but kept running; report it anyway
+        # Only transition to EXITED if we weren't killing it meanwhile
+        if self._status in (PTYStatus.KILLING, PTYStatus.KILLED):
+            return
+        self._status = PTYStatus.EXITED
+        logger.info("PTY session %s exited (code=%s)", self.id, exit_code)
+        if self._on_exit:
+            try:
+                self._on_exit(self, exit_code)
+            except Exception:
+                logger.exception("Error in on_exit callback for session %s", self.id)
+
+    def _remove_reader(self) -> None:
+        if self._loop is None:
+            return
         try:
-            while self._status == PTYStatus.RUNNING:
-                try:
-                    data = await loop.run_in_executor(
-                        None, lambda: os.read(self._master_fd, 4096)
-                    )
-                except OSError:
-                    break
-
-                if not data:
-                    break
-
-                raw_text = data.decode("utf-8", errors="replace")
-                cleaned = strip_ansi(raw_text)
-                cleaned = sanitize_binary_output(cleaned)
-                self.buffer.append_text(cleaned, raw_text=raw_text)
-        except Exception as e:
-            logger.debug("PTY reader %s ended: %s", self.id, e)
-        finally:
-            # Only transition to EXITED if we weren't already killing
-            if self._status == PTYStatus.RUNNING:
-                exit_code = self._proc.poll() if self._proc else None
-                self._status = PTYStatus.EXITED
-                logger.info("PTY session %s exited (code=%s)", self.id, exit_code)
-                if self._on_exit:
-                    try:
-                        self._on_exit(self, exit_code)
-                    except Exception:
-                        logger.exception(
-                            "Error in on_exit callback for session %s", self.id
-                        )
+            self._loop.remove_reader(self._master_fd)
+        except Exception:
+            pass  # loop already closed
+        self._loop = None
+
+    def _ingest(self, data: bytes) -> None:
+        """Decode, clean and buffer a block of PTY output."""
+        raw_text = data.decode("utf-8", errors="replace")
+        cleaned = strip_ansi(raw_text)
+        cleaned = sanitize_binary_output(cleaned)
+        self.buffer.append_text(cleaned, raw_text=raw_text)
 
     async def send(self, data: str, timeout: float = 30.0) -> str:
         """Send input to the PTY and capture output.
@@ -165,6 +328,14 @@ class PTYSession:
         Returns:
             New output produced after the command.
         """
+        return "\n".join(await self.send_lines(data, timeout))
+
+    async def send_lines(self, data: str, timeout: float = 30.0) -> list[str]:
+        """Like :meth:`send`, but return the output as a list of lines.
+
+        Callers that only inspect a few lines (e.g. the last one) avoid
+        joining the whole output into one string.
+        """
         if self._status != PTYStatus.RUNNING:
             raise RuntimeError(f"PTY session {self.id} is not running")
 
@@ -172,22 +343,29 @@ class PTYSession:
         before = self.buffer.line_count
 
         # Send the command
-        if not data.endswith("\n"):
-            data += "\n"
-        os.write(self._master_fd, data.encode())
+        await self._write_line(data)
 
         # Wait for output to settle
-        output_lines = await self._wait_for_output(before, timeout)
-        return "\n".join(output_lines)
+        return await self._wait_for_output(before, timeout)
+
+    async def write(self, data: str) -> None:
+        """Send input to the PTY without waiting for any output.
+
+        Args:
+            data: Input to send (a \\n is appended if missing).
+        """
+        if self._status != PTYStatus.RUNNING:
+            raise RuntimeError(f"PTY session {self.id} is not running")
+        await self._write_line(data)
 
     async def send_and_match(
-        self, data: str, pattern: str, timeout: float = 30.0
+        self, data: str, pattern: str | re.Pattern[str], timeout: float = 30.0
     ) -> str:
         """Send input and wait for a regex pattern in the output.
 
         Args:
             data: Command to send.
-            pattern: Regex pattern to wait for.
+            pattern: Regex pattern (string or compiled) to wait for.
             timeout: Maximum seconds to wait.
 
         Returns:
@@ -198,30 +376,109 @@ class PTYSession:
 
         before = self.buffer.line_count
 
-        if not data.endswith("\n"):
-            data += "\n"
-        os.write(self._master_fd, data.encode())
+        await self._write_line(data)
 
-        compiled = re.compile(pattern)
+        if isinstance(pattern, re.Pattern):
+            matches = _line_matcher(pattern.pattern, pattern.flags)
+        else:
+            matches = _line_matcher(pattern)
         loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout
-
-        while loop.time() < deadline:
-            current = self.buffer.line_count
-            if current > before:
-                new_lines = self.buffer.read(offset=before, limit=current - before)
-                for i, line in enumerate(new_lines):
-                    if compiled.search(line):
-                        return "\n".join(new_lines[: i + 1])
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                break
-            await self.buffer.wait_for_data(timeout=min(remaining, 0.5))
+        now = loop.time()
+        deadline = now + timeout
+        scanned = before  # lines already tested against the pattern
+
+        while now < deadline:
+            version = self.buffer.version
+            if self.buffer.line_count > scanned:
+                for line in self.buffer.iter_from(scanned):
+                    scanned += 1
+                    if matches(line):
+                        return self.buffer.read_text(before, scanned - before)
+            # No polling cap needed: since= means no wakeup can be missed
+            await self.buffer.wait_for_data(timeout=deadline - now, since=version)
+            now = loop.time()
 
         # Timeout — return whatever we have
-        current = self.buffer.line_count
-        new_lines = self.buffer.read(offset=before, limit=current - before)
-        return "\n".join(new_lines)
+        return self.buffer.read_text(before, self.buffer.line_count - before)
+
+    async def _write_line(self, data: str) -> None:
+        """Write ``data`` to the PTY, adding a trailing newline if missing.
+
+        Lines sent in the same loop tick (concurrent ``send()`` calls) are
+        coalesced: the first one opens a batch and schedules a
+        session-owned ``_flush_writes`` task, later ones join the batch,
+        and the task sends it all with one ``writev``.  Text and newline
+        are separate iovecs, so no concatenated copy is made.  Callers only
+        wait for the flush, so cancelling one never drops another's line.
+        """
+        iov = _line_iov(data.encode())
+        batch = self._write_batch
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            batch = self._write_batch = ([], loop.create_future())
+            task = loop.create_task(self._flush_writes(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        batch[0].extend(iov)
+        await asyncio.shield(batch[1])
+
+    async def _flush_writes(
+        self, batch: tuple[list[bytes], asyncio.Future[None]]
+    ) -> None:
+        """Write one batch of queued input, after any batch ahead of it."""
+        iov, done = batch
+        try:
+            async with self._write_lock:
+                # Close the batch; sends from now on start the next one
+                if self._write_batch is batch:
+                    self._write_batch = None
+                await self._write_all(iov)
+        except asyncio.CancelledError:  # loop shutting down
+            done.cancel()
+            raise
+        except Exception as exc:
+            done.set_exception(exc)
+            done.exception()  # mark retrieved; callers may all be gone
+        else:
+            done.set_result(None)
+        finally:
+            if self._write_batch is batch:
+                self._write_batch = None
+
+    async def _write_all(self, iov: list[bytes]) -> None:
+        """Write ``iov`` in full.
+
+        The master fd is non-blocking, so when the tty input queue is full
+        the rest is written as it drains.
+        """
+        if len(iov) > _MAX_IOV:
+            iov = [b"".join(iov)]
+        try:
+            written = os.writev(self._master_fd, iov)
+        except BlockingIOError:
+            written = 0
+        if written == sum(map(len, iov)):
+            return
+        rest = memoryview(b"".join(iov))[written:]
+        while rest:
+            await self._writable()
+            try:
+                rest = rest[os.write(self._master_fd, rest) :]
+            except BlockingIOError:
+                pass
+
+    async def _writable(self) -> None:
+        """Wait until the master fd can take more input."""
+        # EOF clears _loop (and may do so while we wait), so keep our own ref
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError(f"PTY session {self.id} closed while writing")
+        fut = loop.create_future()
+        loop.add_writer(self._master_fd, lambda: fut.done() or fut.set_result(None))
+        try:
+            await fut
+        finally:
+            loop.remove_writer(self._master_fd)
 
     async def _wait_for_output(
         self, start_line: int, timeout: float, settle_time: float = 0.3
@@ -232,27 +489,27 @@ class PTYSession:
         Returns new lines produced after start_line.
         """
         loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout
+        now = loop.time()  # refreshed once per wakeup
+        deadline = now + timeout
         last_count = start_line
         settled_at = None
 
-        while loop.time() < deadline:
+        while now < deadline:
+            version = self.buffer.version
             current = self.buffer.line_count
             if current > last_count:
                 last_count = current
-                settled_at = loop.time()
-            elif settled_at and (loop.time() - settled_at) > settle_time:
+                settled_at = now
+            elif settled_at is not None and (now - settled_at) > settle_time:
                 # Output has settled
                 break
             elif current > start_line and settled_at is None:
-                settled_at = loop.time()
+                settled_at = now
 
             # Wait for new data or settle timeout, whichever comes first
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                break
-            wait_time = settle_time if settled_at else min(remaining, 0.5)
-            await self.buffer.wait_for_data(timeout=wait_time)
+            wait_time = settle_time if settled_at is not None else deadline - now
+            await self.buffer.wait_for_data(timeout=wait_time, since=version)
+            now = loop.time()
 
         # Return new lines
         count = self.buffer.line_count - start_line
@@ -267,19 +524,19 @@ class PTYSession:
 
         self._status = PTYStatus.KILLING
         try:
-            os.killpg(self._pgid, signal.SIGKILL)
-            logger.info("Killed PTY session %s (pgid=%d)", self.id, self._pgid)
+            # pgid is 0 until start() spawns the child, and killpg(0, ...)
+            # would signal our own process group.
+            if self._pgid > 0:
+                os.killpg(self._pgid, signal.SIGKILL)
+                logger.info("Killed PTY session %s (pgid=%d)", self.id, self._pgid)
         except ProcessLookupError:
             logger.debug("Process group already gone: %d", self._pgid)
         except Exception as e:
             logger.warning("Error killing PTY session %s: %s", self.id, e)
 
-        # Wait for process to be reaped (avoids zombies)
-        if self._proc is not None:
-            try:
-                self._proc.wait(timeout=2)
-            except Exception:
-                pass
+        # No need to wait here: the event loop's child watcher reaps the
+        # process (no zombies) and completes wait_for_exit() waiters.
+        self._remove_reader()
 
         try:
             os.close(self._master_fd)
@@ -288,6 +545,31 @@ class PTYSession:
 
         self._status = PTYStatus.KILLED
 
+    async def aclose(self, timeout: float = 2.0) -> int | None:
+        """Shut the process tree down gracefully, escalating to ``kill()``.
+
+        Sends SIGHUP to the process group (what a terminal hangup would
+        deliver; interactive shells ignore SIGTERM) and awaits exit for up to
+        ``timeout`` seconds without blocking the loop, then kills whatever is
+        left and releases the PTY.
+
+        Returns:
+            The exit code, or None if the process had to be SIGKILLed and
+            has not been reaped yet.
+        """
+        if self._status not in (PTYStatus.RUNNING, PTYStatus.KILLING):
+            return self._proc.returncode if self._proc else None
+
+        self._status = PTYStatus.KILLING
+        if self._pgid > 0:
+            try:
+                os.killpg(self._pgid, signal.SIGHUP)
+            except ProcessLookupError:
+                pass
+        code = await self.wait_for_exit(timeout)
+        self.kill()
+        return code
+
     @property
     def alive(self) -> bool:
         return self._status == PTYStatus.RUNNING
@@ -300,23 +582,37 @@ class PTYSession:
         """Wait for the process to exit. Returns exit code or None on timeout."""
         if self._proc is None:
             return -1
-        try:
-            loop = asyncio.get_running_loop()
-            deadline = loop.time() + timeout
-            while loop.time() < deadline:
-                ret = self._proc.poll()
-                if ret is not None:
-                    if self._status == PTYStatus.RUNNING:
-                        self._status = PTYStatus.EXITED
-                    return ret
-                await asyncio.sleep(0.1)
-        except Exception:
-            if self._status == PTYStatus.RUNNING:
-                self._status = PTYStatus.EXITED
-            return -1
-        return None
+        # Already reaped by the child watcher: skip the wait_for task
+        ret = self._proc.returncode
+        if ret is None:
+            try:
+                ret = await asyncio.wait_for(self._proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+            except Exception:
+                ret = -1
+        if self._status == PTYStatus.RUNNING:
+            self._status = PTYStatus.EXITED
+        return ret
 
     def __del__(self) -> None:
-        """Ensure cleanup on garbage collection."""
-        if self._status in (PTYStatus.RUNNING, PTYStatus.KILLING):
-            self.kill()
+        """Best-effort cleanup on garbage collection.
+
+        Only signals the process group and closes the master fd: no logging
+        and no event-loop calls, since either may already be torn down at
+        interpreter exit.  The loop's reader callback holds a reference to
+        the session, so a session being collected has none registered.
+        Orderly shutdown is ``kill()`` / ``aclose()``.
+        """
+        if self._status not in (PTYStatus.RUNNING, PTYStatus.KILLING):
+            return
+        if self._pgid > 0:
+            try:
+                os.killpg(self._pgid, signal.SIGKILL)
+            except OSError:
+                pass
+        if self._master_fd >= 0:
+            try:
+                os.close(self._master_fd)
+            except OSError:
+                pass
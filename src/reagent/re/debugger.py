@@ -13,13 +13,15 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
+import html
 import logging
 import os
+import platform
 import re
 import shutil
-import threading
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from typing import Any, Callable, ClassVar, Iterator
 
 from pydantic import BaseModel, Field
 
@@ -40,10 +42,15 @@ class DebuggerType(enum.StrEnum):
     LLDB = "lldb"
 
 
+# Prompt each debugger prints when it is ready for input
+_PROMPTS: dict[DebuggerType, str] = {
+    DebuggerType.GDB: "(gdb)",
+    DebuggerType.LLDB: "(lldb)",
+}
+
 # Prompt patterns for detecting when the debugger is ready
-_PROMPT_PATTERNS: dict[DebuggerType, str] = {
-    DebuggerType.GDB: r"\(gdb\)\s*$",
-    DebuggerType.LLDB: r"\(lldb\)\s*$",
+_PROMPT_PATTERNS: dict[DebuggerType, re.Pattern[str]] = {
+    dbg: re.compile(rf"{re.escape(prompt)}\s*$") for dbg, prompt in _PROMPTS.items()
 }
 
 # Command translation: abstract -> debugger-specific
@@ -76,6 +83,7 @@ _CMD_MAP: dict[DebuggerType, dict[str, str]] = {
         "step_out": "finish",
         "breakpoint": "breakpoint set --name {location}",
         "breakpoint_addr": "breakpoint set --address {address}",
+        "breakpoint_fileline": "breakpoint set --file {file} --line {line}",
         "breakpoint_delete": "breakpoint delete {number}",
         "registers": "register read",
         "registers_all": "register read --all",
@@ -92,20 +100,85 @@ _CMD_MAP: dict[DebuggerType, dict[str, str]] = {
 }
 
 
+def _compile_template(template: str) -> Callable[[dict[str, str] | None], str]:
+    """Turn a ``_CMD_MAP`` template into a command builder.
+
+    Parameterless templates return the constant string without going
+    through ``str.format``.
+    """
+    if "{" not in template:
+        return lambda params: template
+    return lambda params: template.format_map(params) if params else template
+
+
+# (debugger, abstract command) -> builder, so a command is one lookup and call
+_CMD_FN: dict[tuple[DebuggerType, str], Callable[[dict[str, str] | None], str]] = {
+    (dbg, name): _compile_template(template)
+    for dbg, commands in _CMD_MAP.items()
+    for name, template in commands.items()
+}
+
+
+def _render_command(
+    dbg_type: DebuggerType, abstract_cmd: str, params: dict[str, str] | None = None
+) -> str:
+    """Translate an abstract command to ``dbg_type``'s syntax."""
+    build = _CMD_FN.get((dbg_type, abstract_cmd))
+    if build is None:
+        raise ValueError(f"Unknown abstract command '{abstract_cmd}' for {dbg_type}")
+    return build(params)
+
+
+# (debugger, location kind) -> abstract breakpoint command. LLDB needs a
+# different command per kind; anything not listed uses "breakpoint".
+_BP_DISPATCH: dict[tuple[DebuggerType, str], str] = {
+    (DebuggerType.LLDB, "addr"): "breakpoint_addr",
+    (DebuggerType.LLDB, "fileline"): "breakpoint_fileline",
+}
+
+
+def _location_kind(location: str) -> str:
+    """Classify a breakpoint location as ``addr``, ``fileline`` or ``name``."""
+    if location.startswith("0x"):
+        return "addr"
+    if ":" in location:
+        return "fileline"
+    return "name"
+
+
+@functools.lru_cache(maxsize=256)
+def _echo_filter(prompt: str, command: str) -> re.Pattern[str]:
+    """Regex matching the echoed ``command`` line and prompt-only lines.
+
+    Lines match when, stripped of surrounding whitespace, they equal the
+    command or the prompt; ``sub("", ...)`` drops them in one pass.
+    """
+    targets = f"{re.escape(command.strip())}|{re.escape(prompt)}"
+    return re.compile(rf"(?m)^[^\S\n]*(?:{targets})[^\S\n]*(?:\n|\Z)")
+
+
 def _xml_wrap(tag: str, content: str, **attrs: str) -> str:
     """Wrap content in an XML tag with optional attributes.
 
     Provides structural cues to the LLM so it can reliably parse
     debug tool output (inspired by opencode-pty's XML-tagged responses).
     """
-    attr_str = "".join(f' {k}="{v}"' for k, v in attrs.items())
-    return f"<{tag}{attr_str}>\n{content}\n</{tag}>"
+    if not attrs:
+        return f"<{tag}>\n{content}\n</{tag}>"
+    parts = [f"<{tag}"]
+    for k, v in attrs.items():
+        parts.append(f' {k}="{html.escape(v, quote=True)}"')
+    parts.append(f">\n{content}\n</{tag}>")
+    return "".join(parts)
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_debugger() -> str | None:
-    """Detect available debugger, preferring LLDB on macOS."""
-    import platform
+    """Detect available debugger, preferring LLDB on macOS.
 
+    The PATH scan runs once per process; ``_detect_debugger.cache_clear()``
+    forces a re-probe.
+    """
     if platform.system() == "Darwin":
         # macOS: prefer lldb
         if shutil.which("lldb"):
@@ -121,12 +194,33 @@ def _detect_debugger() -> str | None:
     return None
 
 
+def _debugger_argv(
+    dbg_type: DebuggerType, binary_path: str, args: list[str] | None = None
+) -> list[str]:
+    """Build the debugger command line.
+
+    Program arguments are set by a startup command (GDB ``-ex``, LLDB
+    ``-o``) that runs once the binary is loaded, before the first prompt,
+    so launch needs no separate round-trip for them.
+    """
+    if dbg_type == DebuggerType.GDB:
+        argv = ["gdb", "-q", "--nx"]
+        if args:
+            argv += ["-ex", f"set args {' '.join(args)}"]
+    else:
+        argv = ["lldb", "--no-use-colors"]
+        if args:
+            argv += ["-o", f"settings set target.run-args {' '.join(args)}"]
+    argv.append(binary_path)
+    return argv
+
+
 # ---------------------------------------------------------------------------
 # Debug session registry
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DebugSessionInfo:
     """Tracks a live debugger session."""
 
@@ -142,8 +236,9 @@ class DebugSessionRegistry:
 
     def __init__(self, pty_manager: PTYManager) -> None:
         self._pty_manager = pty_manager
+        # Only touched from the event loop, and each access is a single
+        # dict operation, so no lock is needed (same as PTYManager).
         self._sessions: dict[str, DebugSessionInfo] = {}
-        self._lock = threading.Lock()
 
     async def launch(
         self,
@@ -161,35 +256,21 @@ class DebugSessionRegistry:
         if dbg_type not in (DebuggerType.GDB, DebuggerType.LLDB):
             raise ValueError(f"Unknown debugger type: {dbg_type}")
 
-        # Build command
-        if dbg_type == DebuggerType.GDB:
-            cmd = ["gdb", "-q", "--nx", binary_path]
-        else:
-            cmd = ["lldb", "--no-use-colors", binary_path]
-
-        # If args provided, we'll set them after launch
-        cwd = os.path.dirname(os.path.abspath(binary_path)) or "."
+        cmd = _debugger_argv(dbg_type, binary_path, args)
+        directory, name = os.path.split(os.path.abspath(binary_path))
 
         # Spawn PTY session
         pty_session = await self._pty_manager.spawn(
             command=cmd,
-            cwd=cwd,
+            cwd=directory or ".",
             env=env or {},
-            title=f"{dbg_type}: {os.path.basename(binary_path)}",
+            title=f"{dbg_type}: {name}",
         )
 
-        # Wait for initial prompt
-        prompt_pattern = re.compile(_PROMPT_PATTERNS[dbg_type])
+        # Wait for initial prompt (arguments are already set by then)
+        prompt_pattern = _PROMPT_PATTERNS[dbg_type]
         await self._wait_for_prompt(pty_session, prompt_pattern, timeout=10.0)
 
-        # Set arguments if provided
-        if args:
-            if dbg_type == DebuggerType.GDB:
-                set_args_cmd = f"set args {' '.join(args)}"
-            else:
-                set_args_cmd = f"settings set target.run-args {' '.join(args)}"
-            await self._send_cmd(pty_session, set_args_cmd, prompt_pattern)
-
         info = DebugSessionInfo(
             session_id=pty_session.id,
             pty_session=pty_session,
@@ -198,28 +279,18 @@ class DebugSessionRegistry:
             prompt_pattern=prompt_pattern,
         )
 
-        with self._lock:
-            self._sessions[pty_session.id] = info
+        self._sessions[pty_session.id] = info
 
         return info
 
     def get(self, session_id: str) -> DebugSessionInfo | None:
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     async def send_command(
         self, session_id: str, command: str, timeout: float = 30.0
     ) -> str:
         """Send a raw command to the debugger and return output."""
-        info = self.get(session_id)
-        if not info:
-            raise ValueError(f"No debug session with ID '{session_id}'")
-        if not info.pty_session.alive:
-            raise RuntimeError(f"Debug session '{session_id}' is no longer running")
-
-        return await self._send_cmd(
-            info.pty_session, command, info.prompt_pattern, timeout
-        )
+        return await self.send_on(self._require(session_id), command, timeout)
 
     async def send_abstract_command(
         self,
@@ -229,38 +300,23 @@ class DebugSessionRegistry:
         timeout: float = 30.0,
     ) -> str:
         """Send an abstract command, translated to the right debugger syntax."""
-        info = self.get(session_id)
-        if not info:
-            raise ValueError(f"No debug session with ID '{session_id}'")
-
-        cmd_map = _CMD_MAP[info.debugger_type]
-        template = cmd_map.get(abstract_cmd)
-        if not template:
-            raise ValueError(
-                f"Unknown abstract command '{abstract_cmd}' for {info.debugger_type}"
-            )
-
-        if params:
-            command = template.format(**params)
-        else:
-            command = template
-
-        return await self.send_command(session_id, command, timeout)
+        info = self._require(session_id)
+        command = _render_command(info.debugger_type, abstract_cmd, params)
+        return await self.send_on(info, command, timeout)
 
     async def kill(self, session_id: str) -> None:
         """Kill a debug session."""
-        with self._lock:
-            info = self._sessions.pop(session_id, None)
+        info = self._sessions.pop(session_id, None)
         if info:
-            # Try graceful quit first via the PTY send API
+            # Try graceful quit first, returning as soon as the debugger exits
+            session = info.pty_session
             try:
-                if info.pty_session.alive:
-                    await info.pty_session.send("quit", timeout=2.0)
-                    await asyncio.sleep(0.3)
-                    if info.pty_session.alive:
+                if session.alive:
+                    await session.write("quit")
+                    if await session.wait_for_exit(timeout=0.5) is None:
                         # Force confirm quit (GDB asks "Quit anyway?")
-                        await info.pty_session.send("y", timeout=2.0)
-                        await asyncio.sleep(0.2)
+                        await session.write("y")
+                        await session.wait_for_exit(timeout=0.3)
             except Exception as e:
                 logger.debug(
                     "Error during graceful debugger quit for %s: %s", session_id, e
@@ -268,42 +324,56 @@ class DebugSessionRegistry:
             # Force kill via PTY manager
             await self._pty_manager.kill(session_id)
 
+    def iter_sessions(self) -> Iterator[DebugSessionInfo]:
+        """Iterate over a snapshot of the registered sessions."""
+        return iter(list(self._sessions.values()))
+
     def list_sessions(self) -> list[dict[str, Any]]:
-        with self._lock:
-            return [
-                {
-                    "id": info.session_id,
-                    "debugger": info.debugger_type,
-                    "binary": info.binary_path,
-                    "alive": info.pty_session.alive,
-                }
-                for info in self._sessions.values()
-            ]
+        return [
+            {
+                "id": info.session_id,
+                "debugger": info.debugger_type,
+                "binary": info.binary_path,
+                "alive": info.pty_session.alive,
+            }
+            for info in self.iter_sessions()
+        ]
+
+    def _require(self, session_id: str) -> DebugSessionInfo:
+        info = self._sessions.get(session_id)
+        if not info:
+            raise ValueError(f"No debug session with ID '{session_id}'")
+        return info
+
+    async def send_on(
+        self, info: DebugSessionInfo, command: str, timeout: float = 30.0
+    ) -> str:
+        """Send a raw command to a session the caller already got via ``get()``.
+
+        Skips the registry lookup; the liveness check still applies.
+        """
+        if not info.pty_session.alive:
+            raise RuntimeError(
+                f"Debug session '{info.session_id}' is no longer running"
+            )
+        return await self._send_cmd(
+            info.pty_session, command, info.debugger_type, timeout
+        )
 
     async def _send_cmd(
         self,
         pty_session: PTYSession,
         command: str,
-        prompt_pattern: re.Pattern,
+        debugger_type: DebuggerType,
         timeout: float = 30.0,
     ) -> str:
         """Send command and wait for the prompt to reappear."""
         output = await pty_session.send_and_match(
-            command, prompt_pattern.pattern, timeout=timeout
+            command, _PROMPT_PATTERNS[debugger_type], timeout=timeout
         )
-        # Clean up: strip the echoed command and trailing prompt
-        lines = output.split("\n")
-        cleaned = []
-        for line in lines:
-            stripped = line.strip()
-            # Skip echoed command line
-            if stripped == command.strip():
-                continue
-            # Skip prompt-only lines
-            if prompt_pattern.fullmatch(stripped):
-                continue
-            cleaned.append(line)
-        return "\n".join(cleaned).strip()
+        # Clean up: strip the echoed command and prompt-only lines
+        echo = _echo_filter(_PROMPTS[debugger_type], command)
+        return echo.sub("", output).strip()
 
     async def _wait_for_prompt(
         self,
@@ -311,18 +381,23 @@ class DebugSessionRegistry:
         prompt_pattern: re.Pattern,
         timeout: float = 10.0,
     ) -> None:
-        """Wait for the debugger prompt to appear in the output."""
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout
-        while loop.time() < deadline:
+        """Wait for the debugger prompt to appear in the output.
+
+        The tail is checked before each wait, and ``since=`` makes the wait
+        return at once if output landed after that check, so a prompt is
+        seen as soon as it arrives without a polling interval.
+        """
+        now = asyncio.get_running_loop().time
+        deadline = now() + timeout
+        remaining = timeout
+        while remaining > 0:
+            version = pty_session.buffer.version
             tail = pty_session.buffer.read_tail(5)
             for line in tail:
                 if prompt_pattern.search(line):
                     return
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                break
-            await pty_session.buffer.wait_for_data(timeout=min(remaining, 0.5))
+            await pty_session.buffer.wait_for_data(timeout=remaining, since=version)
+            remaining = deadline - now()
         logger.warning("Timed out waiting for debugger prompt")
 
 
@@ -349,6 +424,22 @@ class DebugLaunchParams(BaseModel):
     )
 
 
+def _resolve_binary(cwd: str, binary_path: str) -> str | None:
+    """Resolve ``binary_path`` to an existing file, or ``None``.
+
+    A relative path is tried against the agent's working directory first
+    (it may differ from ours, e.g. a --mask temp dir), then against the
+    process cwd (the project root).  Each candidate is stat()ed once.
+    """
+    binary = os.path.abspath(os.path.join(cwd, binary_path))
+    if os.path.isfile(binary):
+        return binary
+    fallback = os.path.abspath(binary_path)
+    if fallback != binary and os.path.isfile(fallback):
+        return fallback
+    return None
+
+
 class DebugLaunchTool(BaseTool[DebugLaunchParams]):
     """Launch a debugger session for a binary."""
 
@@ -367,29 +458,11 @@ class DebugLaunchTool(BaseTool[DebugLaunchParams]):
 
     async def execute(self, params: DebugLaunchParams) -> ToolResult:
         try:
-            # Resolve binary path
-            # If the path is relative, first try resolving it against the current working directory.
-            # If that fails, it might be because the agent is operating in a different directory (e.g., --mask temp dir)
-            # but the Python process is in the project root.
-            # We trust the agent's intent if the file exists in the directory implied by the shell tool.
-
-            # Attempt to resolve against the provided CWD
-            binary = os.path.abspath(os.path.join(self._cwd, params.binary_path))
-
-            # If not found there, try normal resolution (project root)
-            if not os.path.isfile(binary):
-                binary_fallback = os.path.abspath(params.binary_path)
-                if os.path.isfile(binary_fallback):
-                    binary = binary_fallback
-                else:
-                    # One last try: check relative to CWD if params.binary_path is relative
-                    if not os.path.isabs(params.binary_path):
-                        # Already checked join(self._cwd, params.binary_path) above
-                        pass
-
-            if not os.path.isfile(binary):
+            binary = _resolve_binary(self._cwd, params.binary_path)
+            if binary is None:
+                missing = os.path.abspath(os.path.join(self._cwd, params.binary_path))
                 return ToolError(
-                    output=f"Binary not found: {binary} (cwd: {self._cwd})"
+                    output=f"Binary not found: {missing} (cwd: {self._cwd})"
                 )
 
             info = await self._registry.launch(
@@ -466,11 +539,10 @@ class DebugBreakpointTool(BaseTool[DebugBreakpointParams]):
                 return ToolError(output=f"No debug session '{params.session_id}'")
 
             if params.delete:
-                output = await self._registry.send_abstract_command(
-                    params.session_id,
-                    "breakpoint_delete",
-                    {"number": params.location},
+                cmd = _render_command(
+                    info.debugger_type, "breakpoint_delete", {"number": params.location}
                 )
+                output = await self._registry.send_on(info, cmd)
                 return ToolOk(
                     output=_xml_wrap(
                         "debug_output",
@@ -482,28 +554,22 @@ class DebugBreakpointTool(BaseTool[DebugBreakpointParams]):
                     brief=f"deleted breakpoint {params.location}",
                 )
 
-            # Detect if it's an address (0x...) for LLDB special handling
             location = params.location
-            if info.debugger_type == DebuggerType.LLDB and location.startswith("0x"):
-                output = await self._registry.send_abstract_command(
-                    params.session_id,
-                    "breakpoint_addr",
-                    {"address": location},
-                )
-            else:
-                # For LLDB with function names, use --name
-                # For file:line, send raw command
-                if info.debugger_type == DebuggerType.LLDB and ":" in location:
-                    # file:line format
-                    parts = location.rsplit(":", 1)
-                    cmd = f"breakpoint set --file {parts[0]} --line {parts[1]}"
-                    output = await self._registry.send_command(params.session_id, cmd)
-                else:
-                    output = await self._registry.send_abstract_command(
-                        params.session_id,
-                        "breakpoint",
-                        {"location": location},
-                    )
+            abstract_cmd = _BP_DISPATCH.get(
+                (info.debugger_type, _location_kind(location)), "breakpoint"
+            )
+            file, _, line = location.rpartition(":")
+            cmd = _render_command(
+                info.debugger_type,
+                abstract_cmd,
+                {
+                    "location": location,
+                    "address": location,
+                    "file": file,
+                    "line": line,
+                },
+            )
+            output = await self._registry.send_on(info, cmd)
 
             return ToolOk(
                 output=_xml_wrap(
@@ -611,7 +677,7 @@ class DebugRegistersTool(BaseTool[DebugRegistersParams]):
         try:
             cmd = "registers_all" if params.all_registers else "registers"
             output = await self._registry.send_abstract_command(params.session_id, cmd)
-            if not output.strip():
+            if not output or output.isspace():
                 return ToolError(
                     output="No register data. Is the program stopped at a breakpoint?",
                     brief="no registers (not stopped?)",
@@ -634,6 +700,16 @@ class DebugRegistersTool(BaseTool[DebugRegistersParams]):
 # ---------------------------------------------------------------------------
 
 
+# debug_memory format letter -> debugger format. GDB takes other letters as is.
+_GDB_MEM_FMT: dict[str, str] = {"b": "bx"}  # bytes in hex
+_LLDB_MEM_FMT: dict[str, str] = {
+    "x": "hex",
+    "b": "bytes",
+    "s": "c-string",
+    "i": "instruction",
+}
+
+
 class DebugMemoryParams(BaseModel):
     session_id: str = Field(description="Debug session ID from debug_launch.")
     address: str = Field(
@@ -681,27 +757,19 @@ class DebugMemoryTool(BaseTool[DebugMemoryParams]):
             # Format differs between GDB and LLDB
             if info.debugger_type == DebuggerType.GDB:
                 # GDB: x/COUNTformat ADDRESS
-                fmt_char = params.format
-                if fmt_char == "b":
-                    fmt_char = "bx"  # bytes in hex
+                fmt_char = _GDB_MEM_FMT.get(params.format, params.format)
                 cmd = f"x/{params.count}{fmt_char} {params.address}"
             else:
                 # LLDB: memory read ADDRESS --count COUNT --format FORMAT
-                fmt_map = {
-                    "x": "hex",
-                    "b": "bytes",
-                    "s": "c-string",
-                    "i": "instruction",
-                }
-                lldb_fmt = fmt_map.get(params.format, "hex")
+                lldb_fmt = _LLDB_MEM_FMT.get(params.format, "hex")
                 if params.format == "i":
                     # For instructions, use disassemble instead
                     cmd = f"disassemble --start-address {params.address} --count {params.count}"
                 else:
                     cmd = f"memory read {params.address} --count {params.count} --format {lldb_fmt}"
 
-            output = await self._registry.send_command(params.session_id, cmd)
-            if not output.strip():
+            output = await self._registry.send_on(info, cmd)
+            if not output or output.isspace():
                 return ToolError(
                     output="No memory data. Is the program stopped? Is the address valid?",
                     brief="memory read failed",
@@ -753,7 +821,7 @@ class DebugBacktraceTool(BaseTool[DebugBacktraceParams]):
         try:
             cmd = "backtrace_full" if params.full else "backtrace"
             output = await self._registry.send_abstract_command(params.session_id, cmd)
-            if not output.strip():
+            if not output or output.isspace():
                 return ToolError(
                     output="No backtrace. Is the program stopped at a breakpoint?",
                     brief="no backtrace",
@@ -871,6 +939,9 @@ class DebugSessionsParams(BaseModel):
     pass  # No parameters
 
 
+_SESSION_ROW = "{:<12} {:<8} {:<6} {}".format
+
+
 class DebugSessionsTool(BaseTool[DebugSessionsParams]):
     """List active debug sessions."""
 
@@ -886,8 +957,15 @@ class DebugSessionsTool(BaseTool[DebugSessionsParams]):
         self._registry = registry
 
     async def execute(self, params: DebugSessionsParams) -> ToolResult:
-        sessions = self._registry.list_sessions()
-        if not sessions:
+        lines = [_SESSION_ROW("ID", "Debugger", "Alive", "Binary"), "-" * 60]
+        for info in self._registry.iter_sessions():
+            alive = "yes" if info.pty_session.alive else "no"
+            row = _SESSION_ROW(
+                info.session_id, info.debugger_type, alive, info.binary_path
+            )
+            lines.append(row)
+        count = len(lines) - 2
+        if not count:
             return ToolOk(
                 output=_xml_wrap(
                     "debug_sessions",
@@ -897,20 +975,13 @@ class DebugSessionsTool(BaseTool[DebugSessionsParams]):
                 brief="0 debug sessions",
             )
 
-        lines = [f"{'ID':<12} {'Debugger':<8} {'Alive':<6} {'Binary'}"]
-        lines.append("-" * 60)
-        for s in sessions:
-            lines.append(
-                f"{s['id']:<12} {s['debugger']:<8} {'yes' if s['alive'] else 'no':<6} {s['binary']}"
-            )
-
         return ToolOk(
             output=_xml_wrap(
                 "debug_sessions",
                 "\n".join(lines),
-                count=str(len(sessions)),
+                count=str(count),
             ),
-            brief=f"{len(sessions)} debug session(s)",
+            brief=f"{count} debug session(s)",
         )
 
 
@@ -919,6 +990,20 @@ class DebugSessionsTool(BaseTool[DebugSessionsParams]):
 # ---------------------------------------------------------------------------
 
 
+# Tools built from the registry alone, in registration order after
+# DebugLaunchTool (which also takes the working directory)
+_REGISTRY_TOOLS: tuple[Callable[[DebugSessionRegistry], BaseTool], ...] = (
+    DebugBreakpointTool,
+    DebugContinueTool,
+    DebugRegistersTool,
+    DebugMemoryTool,
+    DebugBacktraceTool,
+    DebugEvalTool,
+    DebugKillTool,
+    DebugSessionsTool,
+)
+
+
 def create_debugger_tools(
     pty_manager: PTYManager,
     cwd: str | None = None,
@@ -930,15 +1015,6 @@ def create_debugger_tools(
         so it can be cleaned up on shutdown.
     """
     registry = DebugSessionRegistry(pty_manager)
-    tools: list[BaseTool] = [
-        DebugLaunchTool(registry, cwd=cwd),
-        DebugBreakpointTool(registry),
-        DebugContinueTool(registry),
-        DebugRegistersTool(registry),
-        DebugMemoryTool(registry),
-        DebugBacktraceTool(registry),
-        DebugEvalTool(registry),
-        DebugKillTool(registry),
-        DebugSessionsTool(registry),
-    ]
+    tools: list[BaseTool] = [DebugLaunchTool(registry, cwd=cwd)]
+    tools.extend(cls(registry) for cls in _REGISTRY_TOOLS)
     return registry, tools
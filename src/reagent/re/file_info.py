@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import json
 import logging
 import os
+import stat
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal
 
 import lief
 from pydantic import BaseModel, Field
@@ -18,6 +23,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# LIEF logs warnings about unusual headers/sections from its C++ side on
+# every parse, straight to stderr (under the TUI).  Keep errors only.
+# NOTE: This is process-wide LIEF state.
+lief.logging.set_level(lief.logging.LEVEL.ERROR)
+
 
 # ---------------------------------------------------------------------------
 # Shared ELF security feature detection
@@ -44,58 +54,145 @@ class ELFSecurityInfo:
         return "No"
 
 
+_FORMATS = lief.Binary.FORMATS
+_SEG = lief.ELF.Segment
+_ELF_HDR = lief.ELF.Header
+_BIND_NOW_TAGS = (lief.ELF.DynamicEntry.TAG.BIND_NOW, lief.ELF.DynamicEntry.TAG.FLAGS)
+
+# Stack protector imports (glibc/musl, plus the extra-underscore spellings
+# seen on some toolchains)
+_CANARY_NAMES = frozenset(
+    (
+        "__stack_chk_fail",
+        "__stack_chk_fail_local",
+        "__stack_chk_guard",
+        "___stack_chk_fail",
+        "___stack_chk_guard",
+    )
+)
+
+
+def _name(value: Any) -> str:
+    """Bare member name of a LIEF enum (``ARCH.X86_64`` -> ``X86_64``).
+
+    Reads the enum's ``name`` rather than formatting and splitting
+    ``str(value)``; the string form is only a fallback (e.g. empty flags).
+    """
+    name = getattr(value, "name", None)
+    return name if isinstance(name, str) else str(value).split(".")[-1]
+
+
 def _detect_elf_security(binary: Any) -> ELFSecurityInfo:
     """Detect ELF security features from a LIEF binary object.
 
-    Shared by ``_format_elf()`` (display) and ``_update_target()``
-    (model population) to avoid duplicated logic.
+    Shared by ``_format_elf()`` (display) and ``_target_fields()`` (model
+    population) to avoid duplicated logic; ``_inspect()`` runs it once per
+    parse and hands the result to both.  Segments are looked up by type and
+    imported symbols walked once, since every item read crosses into LIEF.
     """
     info = ELFSecurityInfo()
     info.pie = binary.is_pie
 
-    # NX (check PT_GNU_STACK)
-    for seg in binary.segments:
-        seg_type = str(seg.type).split(".")[-1]
-        if seg_type == "GNU_STACK":
-            info.nx = not bool(seg.flags & 1)  # PF_X = 1
-            break
-
-    # RELRO
-    for seg in binary.segments:
-        seg_type = str(seg.type).split(".")[-1]
-        if seg_type == "GNU_RELRO":
-            info.has_relro = True
-            break
+    # NX (first PT_GNU_STACK) and RELRO (any PT_GNU_RELRO); LIEF's typed
+    # lookup finds the first segment of each type without wrapping the rest
+    stack = binary.get(_SEG.TYPE.GNU_STACK)
+    info.nx = stack is not None and _SEG.FLAGS.X not in stack.flags
+    info.has_relro = binary.get(_SEG.TYPE.GNU_RELRO) is not None
     if info.has_relro:
         try:
             for entry in binary.dynamic_entries:
-                entry_tag = str(entry.tag).split(".")[-1]
-                if entry_tag in ("BIND_NOW", "FLAGS") and "NOW" in str(entry):
+                if entry.tag in _BIND_NOW_TAGS and "NOW" in str(entry):
                     info.full_relro = True
                     break
         except Exception:
             pass
 
-    # Stack canary
-    info.canary = any(
-        "stack_chk" in str(sym.name).lower() for sym in binary.imported_symbols
-    )
-
-    # FORTIFY
-    info.fortified = [
-        str(sym.name)
-        for sym in binary.imported_symbols
-        if "_chk" in str(sym.name) and "stack" not in str(sym.name).lower()
-    ]
+    # Stack canary and FORTIFY
+    for sym in binary.imported_symbols:
+        name = sym.name
+        if name in _CANARY_NAMES:
+            info.canary = True
+        elif name.endswith("_chk"):
+            info.fortified.append(name)
 
     return info
 
 
+def _stat_file(path: str) -> os.stat_result | None:
+    """``os.stat`` a regular file, or None if missing or not a regular file.
+
+    The result also supplies the ``_inspect()`` cache key, so one stat
+    covers both the existence check and the key.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+# ---------------------------------------------------------------------------
+# Listing helpers
+# ---------------------------------------------------------------------------
+
+# Symbols listed per table before eliding the rest, for readability
+_SYMBOL_LIMIT = 50
+
+# Section table rows, bound once so the per-section loops skip re-parsing
+# the format spec.
+_ELF_SECTION_ROW = "{:<20} {:<14} {:>8}".format
+_ELF_SECTION_ROW_ENTROPY = "{:<20} {:<14} {:>8}  {:>7.4f}".format
+_PE_SECTION_ROW = "{:<10} {:<14} {:>8} {:>8}{}  {}".format
+_MACHO_SECTION_ROW = "{:<30} {:<14} {:>8}".format
+
+
+def _head(items: Any, limit: int) -> tuple[list[Any], int]:
+    """First ``limit`` items of a LIEF container, plus its total length.
+
+    Only the items shown get Python wrappers; ``len()`` is answered by
+    LIEF without materialising the rest.
+    """
+    return list(itertools.islice(items, limit)), len(items)
+
+
+def _append_symbols(lines: list[str], title: str, symbols: Any) -> None:
+    """Append a capped ``== title (N) ==`` listing of symbol names."""
+    head, total = _head(symbols, _SYMBOL_LIMIT)
+    if not total:
+        return
+    lines.append("")
+    lines.append(f"== {title} ({total}) ==")
+    for sym in head:
+        lines.append(f"  {sym.name}")
+    if total > _SYMBOL_LIMIT:
+        lines.append(f"  ... and {total - _SYMBOL_LIMIT} more")
+
+
+def _symbol_names(symbols: Any) -> dict[str, Any]:
+    """JSON counterpart of ``_append_symbols``: total plus capped names."""
+    head, total = _head(symbols, _SYMBOL_LIMIT)
+    return {"total": total, "names": [sym.name for sym in head]}
+
+
 class FileInfoParams(BaseModel):
     path: str = Field(
         default="",
         description="Path to the binary file to inspect. Leave empty to use the analysis target.",
     )
+    include_entropy: bool = Field(
+        default=False,
+        description=(
+            "Add a per-section entropy column (ELF/PE). Useful for spotting "
+            "packed or encrypted sections; costs a pass over every section's bytes."
+        ),
+    )
+    format: Literal["text", "json"] = Field(
+        default="text",
+        description=(
+            "Output format: 'text' for the readable report, 'json' for the same "
+            "metadata as a JSON object (sections, symbols, libraries, security)."
+        ),
+    )
 
 
 class FileInfoTool(BaseTool[FileInfoParams]):
@@ -130,55 +227,75 @@ class FileInfoTool(BaseTool[FileInfoParams]):
             return ToolError(
                 output="No path provided and no default binary path configured."
             )
-        if not os.path.isfile(path):
+        st = _stat_file(path)
+        if st is None:
             # If the agent gave a bad path but we have a default, try that
-            if params.path and self._binary_path and os.path.isfile(self._binary_path):
+            if (
+                params.path
+                and self._binary_path
+                and (st := _stat_file(self._binary_path)) is not None
+            ):
                 path = self._binary_path
             else:
                 return ToolError(output=f"File not found: {path}")
 
+        path = os.path.abspath(path)
         try:
-            binary = lief.parse(path)
-        except Exception as e:
-            return ToolError(output=f"LIEF could not parse '{path}': {e}")
-
-        if binary is None:
-            return ToolError(
-                output=f"LIEF could not parse '{path}'. It may not be a recognized binary format."
+            # Parsing and formatting are CPU-bound and can take seconds on
+            # large binaries; keep them off the event loop.
+            output, fields = await asyncio.to_thread(
+                _inspect,
+                path,
+                st.st_mtime_ns,
+                st.st_size,
+                params.include_entropy,
+                params.format == "json",
             )
+        except _Unparsable as e:
+            return ToolError(output=str(e))
+
+        # Populate BinaryModel target info and emit wire event (on the loop)
+        self._update_target(path, fields)
+
+        return ToolOk(
+            output=output,
+            brief=f"file_info: {os.path.basename(path)}",
+        )
 
+    @staticmethod
+    def _describe(
+        binary: Any, fmt: Any, sec: ELFSecurityInfo | None, include_entropy: bool
+    ) -> str:
+        """Render the file_info report for a parsed binary of format ``fmt``."""
         lines: list[str] = []
 
-        # Detect format and dispatch
-        if lief.is_elf(path):
-            self._format_elf(binary, lines)
-        elif lief.is_pe(path):
-            self._format_pe(binary, lines)
-        elif lief.is_macho(path):
-            self._format_macho(binary, lines)
+        # Dispatch on the format LIEF detected while parsing
+        if sec is not None:
+            FileInfoTool._format_elf(binary, lines, sec, include_entropy)
+        elif fmt == _FORMATS.PE:
+            FileInfoTool._format_pe(binary, lines, include_entropy)
+        elif fmt == _FORMATS.MACHO:
+            FileInfoTool._format_macho(binary, lines)
         else:
             lines.append(f"Format: Unknown")
-            self._format_generic(binary, lines)
-
-        # Populate BinaryModel target info and emit wire event
-        self._update_target(binary, path)
+            FileInfoTool._format_generic(binary, lines)
 
-        return ToolOk(
-            output="\n".join(lines),
-            brief=f"file_info: {os.path.basename(path)}",
-        )
+        return "\n".join(lines)
 
     # ----- ELF -----
 
-    def _format_elf(self, binary: Any, lines: list[str]) -> None:
+    @staticmethod
+    def _format_elf(
+        binary: Any, lines: list[str], sec: ELFSecurityInfo, include_entropy: bool
+    ) -> None:
         lines.append("Format: ELF")
         header = binary.header
 
         # Basic info
-        machine = str(header.machine_type).split(".")[-1]
-        elf_class = str(header.identity_class).split(".")[-1]
-        elf_type = str(header.file_type).split(".")[-1]
-        endian = str(header.identity_data).split(".")[-1]
+        machine = _name(header.machine_type)
+        elf_class = _name(header.identity_class)
+        elf_type = _name(header.file_type)
+        endian = _name(header.identity_data)
         lines.append(f"Class: {elf_class}")
         lines.append(f"Type: {elf_type}")
         lines.append(f"Machine: {machine}")
@@ -186,7 +303,6 @@ class FileInfoTool(BaseTool[FileInfoParams]):
         lines.append(f"Entry point: 0x{header.entrypoint:x}")
 
         # Security features (shared detection)
-        sec = _detect_elf_security(binary)
         lines.append("")
         lines.append("== Security Features ==")
         lines.append(f"PIE: {'Yes' if sec.pie else 'No'}")
@@ -198,34 +314,36 @@ class FileInfoTool(BaseTool[FileInfoParams]):
         # Sections summary
         lines.append("")
         lines.append("== Sections ==")
-        lines.append(f"{'Name':<20} {'VAddr':<14} {'Size':>8}  {'Entropy':>7}")
-        lines.append("-" * 55)
-        for section in binary.sections:
-            name = section.name or "(null)"
-            vaddr = f"0x{section.virtual_address:08x}"
-            size = section.size
-            entropy = section.entropy
-            lines.append(f"{name:<20} {vaddr:<14} {size:>8}  {entropy:>7.4f}")
+        header_row = _ELF_SECTION_ROW("Name", "VAddr", "Size")
+        if include_entropy:
+            lines.append(f"{header_row}  {'Entropy':>7}")
+            lines.append("-" * 55)
+            for section in binary.sections:
+                lines.append(
+                    _ELF_SECTION_ROW_ENTROPY(
+                        section.name or "(null)",
+                        f"0x{section.virtual_address:08x}",
+                        section.size,
+                        section.entropy,
+                    )
+                )
+        else:
+            lines.append(header_row)
+            lines.append("-" * 44)
+            for section in binary.sections:
+                lines.append(
+                    _ELF_SECTION_ROW(
+                        section.name or "(null)",
+                        f"0x{section.virtual_address:08x}",
+                        section.size,
+                    )
+                )
 
         # Imports
-        imported = list(binary.imported_symbols)
-        if imported:
-            lines.append("")
-            lines.append(f"== Imported Symbols ({len(imported)}) ==")
-            for sym in imported[:50]:  # Cap at 50 for readability
-                lines.append(f"  {sym.name}")
-            if len(imported) > 50:
-                lines.append(f"  ... and {len(imported) - 50} more")
+        _append_symbols(lines, "Imported Symbols", binary.imported_symbols)
 
         # Exports
-        exported = list(binary.exported_symbols)
-        if exported:
-            lines.append("")
-            lines.append(f"== Exported Symbols ({len(exported)}) ==")
-            for sym in exported[:50]:
-                lines.append(f"  {sym.name}")
-            if len(exported) > 50:
-                lines.append(f"  ... and {len(exported) - 50} more")
+        _append_symbols(lines, "Exported Symbols", binary.exported_symbols)
 
         # Libraries
         libs = list(binary.libraries)
@@ -237,15 +355,16 @@ class FileInfoTool(BaseTool[FileInfoParams]):
 
     # ----- PE -----
 
-    def _format_pe(self, binary: Any, lines: list[str]) -> None:
+    @staticmethod
+    def _format_pe(binary: Any, lines: list[str], include_entropy: bool) -> None:
         lines.append("Format: PE")
         header = binary.header
 
-        machine = str(header.machine).split(".")[-1]
+        machine = _name(header.machine)
         lines.append(f"Machine: {machine}")
 
         opt = binary.optional_header
-        lines.append(f"Subsystem: {str(opt.subsystem).split('.')[-1]}")
+        lines.append(f"Subsystem: {_name(opt.subsystem)}")
         lines.append(f"Entry point: 0x{opt.addressof_entrypoint:x}")
         lines.append(f"Image base: 0x{opt.imagebase:x}")
 
@@ -255,7 +374,7 @@ class FileInfoTool(BaseTool[FileInfoParams]):
 
         # ASLR / DYNAMIC_BASE
         dll_chars = opt.dll_characteristics_lists
-        dll_chars_names = [str(c).split(".")[-1] for c in dll_chars]
+        dll_chars_names = [_name(c) for c in dll_chars]
         lines.append(f"ASLR: {'Yes' if 'DYNAMIC_BASE' in dll_chars_names else 'No'}")
         lines.append(f"DEP/NX: {'Yes' if 'NX_COMPAT' in dll_chars_names else 'No'}")
         lines.append(
@@ -266,8 +385,9 @@ class FileInfoTool(BaseTool[FileInfoParams]):
         # Sections
         lines.append("")
         lines.append("== Sections ==")
+        entropy_header = f"  {'Entropy':>7}" if include_entropy else ""
         lines.append(
-            f"{'Name':<10} {'VAddr':<14} {'VSize':>8} {'RawSize':>8}  {'Entropy':>7}  {'Chars'}"
+            _PE_SECTION_ROW("Name", "VAddr", "VSize", "RawSize", entropy_header, "Chars")
         )
         lines.append("-" * 70)
         for section in binary.sections:
@@ -275,13 +395,9 @@ class FileInfoTool(BaseTool[FileInfoParams]):
             vaddr = f"0x{section.virtual_address:08x}"
             vsize = section.virtual_size
             rsize = section.sizeof_raw_data
-            entropy = section.entropy
-            chars = ", ".join(
-                str(c).split(".")[-1] for c in section.characteristics_lists
-            )
-            lines.append(
-                f"{name:<10} {vaddr:<14} {vsize:>8} {rsize:>8}  {entropy:>7.4f}  {chars}"
-            )
+            entropy = f"  {section.entropy:>7.4f}" if include_entropy else ""
+            chars = ", ".join(_name(c) for c in section.characteristics_lists)
+            lines.append(_PE_SECTION_ROW(name, vaddr, vsize, rsize, entropy, chars))
 
         # Imports
         if binary.imports:
@@ -289,39 +405,33 @@ class FileInfoTool(BaseTool[FileInfoParams]):
             lines.append("== Imports ==")
             for imp in binary.imports:
                 lines.append(f"  {imp.name}:")
-                all_entries = list(imp.entries)
-                for entry in all_entries[:20]:
+                entries, total = _head(imp.entries, 20)
+                for entry in entries:
                     if entry.name:
                         lines.append(f"    {entry.name}")
-                remaining = len(all_entries) - 20
+                remaining = total - 20
                 if remaining > 0:
                     lines.append(f"    ... and {remaining} more")
 
         # Exports
         if binary.has_exports:
-            export_entries = list(binary.get_export().entries)
-            if export_entries:
-                lines.append("")
-                lines.append(f"== Exports ({len(export_entries)}) ==")
-                for entry in export_entries[:50]:
-                    lines.append(f"  {entry.name}")
-                if len(export_entries) > 50:
-                    lines.append(f"  ... and {len(export_entries) - 50} more")
+            _append_symbols(lines, "Exports", binary.get_export().entries)
 
     # ----- Mach-O -----
 
-    def _format_macho(self, binary: Any, lines: list[str]) -> None:
+    @staticmethod
+    def _format_macho(binary: Any, lines: list[str]) -> None:
         lines.append("Format: Mach-O")
         header = binary.header
 
-        cpu = str(header.cpu_type).split(".")[-1]
-        file_type = str(header.file_type).split(".")[-1]
+        cpu = _name(header.cpu_type)
+        file_type = _name(header.file_type)
         lines.append(f"CPU: {cpu}")
         lines.append(f"Type: {file_type}")
         lines.append(f"Entry point: 0x{binary.entrypoint:x}")
 
         # Flags
-        flags = [str(f).split(".")[-1] for f in header.flags_list]
+        flags = [_name(f) for f in header.flags_list]
         if flags:
             lines.append(f"Flags: {', '.join(flags)}")
 
@@ -341,14 +451,13 @@ class FileInfoTool(BaseTool[FileInfoParams]):
         # Sections
         lines.append("")
         lines.append("== Sections ==")
-        lines.append(f"{'Segment/Section':<30} {'VAddr':<14} {'Size':>8}")
+        lines.append(_MACHO_SECTION_ROW("Segment/Section", "VAddr", "Size"))
         lines.append("-" * 55)
         for section in binary.sections:
             seg_name = section.segment_name if hasattr(section, "segment_name") else ""
             name = f"{seg_name}/{section.name}" if seg_name else section.name
             vaddr = f"0x{section.virtual_address:08x}"
-            size = section.size
-            lines.append(f"{name:<30} {vaddr:<14} {size:>8}")
+            lines.append(_MACHO_SECTION_ROW(name, vaddr, section.size))
 
         # Libraries
         libs = list(binary.libraries)
@@ -359,28 +468,15 @@ class FileInfoTool(BaseTool[FileInfoParams]):
                 lines.append(f"  {lib.name}")
 
         # Imports
-        imported = list(binary.imported_symbols)
-        if imported:
-            lines.append("")
-            lines.append(f"== Imported Symbols ({len(imported)}) ==")
-            for sym in imported[:50]:
-                lines.append(f"  {sym.name}")
-            if len(imported) > 50:
-                lines.append(f"  ... and {len(imported) - 50} more")
+        _append_symbols(lines, "Imported Symbols", binary.imported_symbols)
 
         # Exports
-        exported = list(binary.exported_symbols)
-        if exported:
-            lines.append("")
-            lines.append(f"== Exported Symbols ({len(exported)}) ==")
-            for sym in exported[:50]:
-                lines.append(f"  {sym.name}")
-            if len(exported) > 50:
-                lines.append(f"  ... and {len(exported) - 50} more")
+        _append_symbols(lines, "Exported Symbols", binary.exported_symbols)
 
     # ----- Generic fallback -----
 
-    def _format_generic(self, binary: Any, lines: list[str]) -> None:
+    @staticmethod
+    def _format_generic(binary: Any, lines: list[str]) -> None:
         if hasattr(binary, "entrypoint"):
             lines.append(f"Entry point: 0x{binary.entrypoint:x}")
         sections = list(binary.sections) if hasattr(binary, "sections") else []
@@ -389,82 +485,232 @@ class FileInfoTool(BaseTool[FileInfoParams]):
             for s in sections:
                 lines.append(f"  {s.name}")
 
-    # ----- Target info update -----
-
-    def _update_target(self, binary: Any, path: str) -> None:
-        """Populate BinaryModel.target and emit a TARGET_INFO wire event."""
-        if self._binary_model is None:
-            return
+    # ----- Structured (JSON) -----
+
+    @staticmethod
+    def _collect(
+        binary: Any,
+        fmt: Any,
+        sec: ELFSecurityInfo | None,
+        fields: dict[str, Any] | None,
+        include_entropy: bool,
+    ) -> dict[str, Any]:
+        """Report data as a JSON-ready dict, skipping the text tables.
+
+        Starts from the target fields (format, arch, security flags) and
+        adds the listings; symbol lists are capped like the text report.
+        """
+        data: dict[str, Any] = {"format": _name(fmt)}
+        data.update(fields or {})
+        if hasattr(binary, "entrypoint"):
+            data["entry_point"] = f"0x{binary.entrypoint:x}"
+        if sec is not None:
+            data["fortified"] = sec.fortified
+
+        sections = []
+        for section in getattr(binary, "sections", ()):
+            row: dict[str, Any] = {
+                "name": section.name.rstrip("\x00"),
+                "vaddr": f"0x{section.virtual_address:x}",
+                "size": section.size,
+            }
+            if include_entropy and fmt != _FORMATS.MACHO:
+                row["entropy"] = round(section.entropy, 4)
+            sections.append(row)
+        data["sections"] = sections
+
+        if fmt == _FORMATS.PE:
+            data["imports"] = {
+                imp.name: [e.name for e in _head(imp.entries, 20)[0] if e.name]
+                for imp in binary.imports
+            }
+            if binary.has_exports:
+                data["exports"] = _symbol_names(binary.get_export().entries)
+        elif fmt in (_FORMATS.ELF, _FORMATS.MACHO):
+            data["imported_symbols"] = _symbol_names(binary.imported_symbols)
+            data["exported_symbols"] = _symbol_names(binary.exported_symbols)
+            data["libraries"] = [
+                lib if isinstance(lib, str) else lib.name for lib in binary.libraries
+            ]
+        return data
 
-        target = self._binary_model.target
-        target.path = path
+    # ----- Target info update -----
 
-        target_data: dict[str, Any] = {}
+    @staticmethod
+    def _target_fields(
+        binary: Any, fmt: Any, sec: ELFSecurityInfo | None
+    ) -> dict[str, Any] | None:
+        """TargetInfo fields derived from ``binary``, or None on failure."""
+        fields: dict[str, Any] = {}
 
         try:
-            if lief.is_elf(path):
+            if sec is not None:
                 header = binary.header
-                target.format = "ELF"
-                target.arch = str(header.machine_type).split(".")[-1]
-                target.endian = (
-                    "little" if "LSB" in str(header.identity_data) else "big"
-                )
-                target.bits = 64 if "CLASS64" in str(header.identity_class) else 32
-                target.stripped = not any(
-                    str(s.type).split(".")[-1] == "SYMTAB" for s in binary.sections
+                fields["format"] = "ELF"
+                fields["arch"] = _name(header.machine_type)
+                fields["endian"] = (
+                    "little" if header.identity_data == _ELF_HDR.ELF_DATA.LSB else "big"
                 )
+                fields["bits"] = 64 if header.identity_class == _ELF_HDR.CLASS.ELF64 else 32
+                # Section lookup by type happens inside LIEF, no per-section wrappers
+                fields["stripped"] = binary.get(lief.ELF.Section.TYPE.SYMTAB) is None
                 # Security features (shared detection)
-                sec = _detect_elf_security(binary)
-                target.pie = sec.pie
-                target.nx = sec.nx
-                target.canary = sec.canary
-                target.relro = (
+                fields["pie"] = sec.pie
+                fields["nx"] = sec.nx
+                fields["canary"] = sec.canary
+                fields["relro"] = (
                     "full"
                     if sec.full_relro
                     else ("partial" if sec.has_relro else "none")
                 )
 
-            elif lief.is_pe(path):
-                target.format = "PE"
-                target.arch = str(binary.header.machine).split(".")[-1]
-                target.endian = "little"
-                target.bits = 64 if "AMD64" in target.arch else 32
+            elif fmt == _FORMATS.PE:
+                arch = _name(binary.header.machine)
+                fields["format"] = "PE"
+                fields["arch"] = arch
+                fields["endian"] = "little"
+                fields["bits"] = 64 if "AMD64" in arch else 32
                 dll_chars = [
-                    str(c).split(".")[-1]
+                    _name(c)
                     for c in binary.optional_header.dll_characteristics_lists
                 ]
-                target.pie = "DYNAMIC_BASE" in dll_chars
-                target.nx = "NX_COMPAT" in dll_chars
+                fields["pie"] = "DYNAMIC_BASE" in dll_chars
+                fields["nx"] = "NX_COMPAT" in dll_chars
 
-            elif lief.is_macho(path):
+            elif fmt == _FORMATS.MACHO:
                 header = binary.header
-                target.format = "Mach-O"
-                target.arch = str(header.cpu_type).split(".")[-1]
-                target.endian = "little"
-                target.bits = 64 if "64" in target.arch else 32
-                flags = [str(f).split(".")[-1] for f in header.flags_list]
-                target.pie = "PIE" in flags
-                target.nx = getattr(binary, "has_nx", False)
-
-            # Build target data dict for wire event
-            target_data = {
-                "format": target.format,
-                "arch": target.arch,
-                "bits": target.bits,
-                "endian": target.endian,
-                "stripped": target.stripped,
-                "pie": target.pie,
-                "nx": target.nx,
-                "canary": target.canary,
-                "relro": target.relro,
-            }
+                arch = _name(header.cpu_type)
+                fields["format"] = "Mach-O"
+                fields["arch"] = arch
+                fields["endian"] = "little"
+                fields["bits"] = 64 if "64" in arch else 32
+                flags = [_name(f) for f in header.flags_list]
+                fields["pie"] = "PIE" in flags
+                fields["nx"] = getattr(binary, "has_nx", False)
 
         except Exception as e:
             logger.warning("Failed to populate target info: %s", e)
+            return None
+
+        return fields
+
+    def _update_target(self, path: str, fields: dict[str, Any] | None) -> None:
+        """Populate BinaryModel.target and emit a TARGET_INFO wire event."""
+        if self._binary_model is None:
             return
 
+        target = self._binary_model.target
+        target.path = path
+        if fields is None:
+            return
+        for name, value in fields.items():
+            setattr(target, name, value)
+
+        # Build target data dict for wire event
+        target_data = {
+            "format": target.format,
+            "arch": target.arch,
+            "bits": target.bits,
+            "endian": target.endian,
+            "stripped": target.stripped,
+            "pie": target.pie,
+            "nx": target.nx,
+            "canary": target.canary,
+            "relro": target.relro,
+        }
+
         if self._wire is not None:
             try:
                 self._wire.send_target_info(target_data)
             except Exception as e:
                 logger.warning("Failed to send target info wire event: %s", e)
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+class _Unparsable(Exception):
+    """LIEF could not parse the file; the message is the tool error."""
+
+
+def _elf_parser_config() -> lief.ELF.ParserConfig:
+    # Relocations, notes, symbol versions and the overlay are never shown
+    config = lief.ELF.ParserConfig()
+    config.parse_relocations = False
+    config.parse_notes = False
+    config.parse_symbol_versions = False
+    config.parse_overlay = False
+    return config
+
+
+def _pe_parser_config() -> lief.PE.ParserConfig:
+    # Resources, signatures, exception data and base relocations are never shown
+    config = lief.PE.ParserConfig()
+    config.parse_rsrc = False
+    config.parse_signature = False
+    config.parse_exceptions = False
+    config.parse_reloc = False
+    return config
+
+
+_ELF_CONFIG = _elf_parser_config()
+_PE_CONFIG = _pe_parser_config()
+
+# Magic prefix -> format-specific parser with its trimmed config
+_PARSERS: tuple[tuple[bytes, Callable[[str], Any]], ...] = (
+    (b"\x7fELF", functools.partial(lief.ELF.parse, config=_ELF_CONFIG)),
+    (b"MZ", functools.partial(lief.PE.parse, config=_PE_CONFIG)),
+)
+
+
+def _parse(path: str) -> Any:
+    """Parse ``path`` with LIEF, skipping the parts file_info never reads.
+
+    The format is sniffed from the file's first bytes: ELF and PE go to
+    the format's own parser with a trimmed ``ParserConfig`` (relocation
+    parsing alone dominates on large binaries), files too short to carry
+    any header are rejected without calling LIEF, and everything else
+    (Mach-O fat binaries included) goes through ``lief.parse``.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if len(magic) < 4:
+        return None
+    for prefix, parse in _PARSERS:
+        if magic.startswith(prefix):
+            return parse(path)
+    return lief.parse(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _inspect(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    include_entropy: bool = False,
+    as_json: bool = False,
+) -> tuple[str, dict[str, Any] | None]:
+    """Parse ``path`` and return its report (text or JSON) and target fields.
+
+    Keyed on the file's mtime and size as well as its path, so a rebuilt
+    binary is parsed again; repeat calls on an unchanged file skip both
+    the LIEF parse and the formatting.  Failures are not cached.
+    """
+    try:
+        binary = _parse(path)
+    except Exception as e:
+        raise _Unparsable(f"LIEF could not parse '{path}': {e}") from e
+    if binary is None:
+        raise _Unparsable(
+            f"LIEF could not parse '{path}'. It may not be a recognized binary format."
+        )
+    # Format from the parsed object; lief.is_*() would re-read the header
+    fmt = binary.format
+    sec = _detect_elf_security(binary) if fmt == _FORMATS.ELF else None
+    fields = FileInfoTool._target_fields(binary, fmt, sec)
+    if as_json:
+        data = FileInfoTool._collect(binary, fmt, sec, fields, include_entropy)
+        return json.dumps(data), fields
+    return FileInfoTool._describe(binary, fmt, sec, include_entropy), fields
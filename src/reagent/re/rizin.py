@@ -6,6 +6,7 @@ The session is opened once on first use and reused across all tool calls.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import threading
@@ -23,6 +24,7 @@ class _RzSession:
     """Thread-safe lazy singleton for a shared rzpipe connection.
 
     Rizin analysis can take seconds; we pay that cost once and reuse the pipe.
+    The lock only guards opening and closing; reads of an open pipe skip it.
     """
 
     def __init__(self, binary_path: str) -> None:
@@ -33,14 +35,24 @@ class _RzSession:
 
     @property
     def pipe(self) -> rzpipe.open:
+        # Fast path: once opened, the pipe is only replaced under the lock
+        # (by close()), so a plain attribute read is enough.
+        pipe = self._pipe
+        if pipe is not None:
+            return pipe
         with self._lock:
             if self._pipe is None:
                 logger.info("Opening rizin session for %s", self._binary_path)
-                self._pipe = rzpipe.open(
-                    self._binary_path, flags=["-2"]
-                )  # -2 = no stderr
+                pipe = rzpipe.open(self._binary_path, flags=["-2"])  # -2 = no stderr
                 # Run initial analysis
-                self._pipe.cmd("aaa")  # Full analysis
+                try:
+                    pipe.cmd("aaa")  # Full analysis
+                except BaseException:
+                    pipe.quit()
+                    raise
+                # Publish only after analysis, so the fast path never sees
+                # a half-initialised pipe
+                self._pipe = pipe
                 self._analyzed = True
                 logger.info("Rizin analysis complete for %s", self._binary_path)
             return self._pipe
@@ -70,17 +82,13 @@ class _RzSession:
                 self._analyzed = False
 
 
-# Global session cache: binary_path -> _RzSession
-_sessions: dict[str, _RzSession] = {}
-_sessions_lock = threading.Lock()
-
-
+# Global session cache: binary_path -> _RzSession.  Tools are built at
+# startup on one thread, and _RzSession() itself is cheap (the pipe opens
+# lazily), so the cache needs no lock of its own.
+@functools.lru_cache(maxsize=None)
 def _get_session(binary_path: str) -> _RzSession:
     """Get or create a shared session for the given binary."""
-    with _sessions_lock:
-        if binary_path not in _sessions:
-            _sessions[binary_path] = _RzSession(binary_path)
-        return _sessions[binary_path]
+    return _RzSession(binary_path)
 
 
 # ---------------------------------------------------------------------------
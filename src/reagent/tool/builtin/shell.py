@@ -139,7 +139,7 @@ class ShellTool(BaseTool[ShellParams]):
 
             # Send the command and wait for the prompt to reappear
             raw_output = await session.send_and_match(
-                full_command, _PROMPT_RE.pattern, timeout=params.timeout
+                full_command, _PROMPT_RE, timeout=params.timeout
             )
 
             output = self._clean_output(raw_output, command, params.stdin)
@@ -172,24 +172,23 @@ class ShellTool(BaseTool[ShellParams]):
 
     async def _wait_for_prompt(self, session: PTYSession, timeout: float = 5.0) -> None:
         """Wait for the sentinel prompt to appear."""
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
+        now = asyncio.get_running_loop().time
+        deadline = now() + timeout
+        remaining = timeout
+        while remaining > 0:
+            version = session.buffer.version
             tail = session.buffer.read_tail(5)
             for line in tail:
                 if _PROMPT_RE.search(line):
                     return
-            remaining = deadline - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                break
-            await session.buffer.wait_for_data(timeout=min(remaining, 0.5))
+            await session.buffer.wait_for_data(timeout=remaining, since=version)
+            remaining = deadline - now()
         logger.warning("Timed out waiting for shell prompt")
 
     async def _get_exit_code(self, session: PTYSession) -> int:
         """Query the exit code of the last command."""
         try:
-            raw = await session.send_and_match(
-                "echo $?", _PROMPT_RE.pattern, timeout=5.0
-            )
+            raw = await session.send_and_match("echo $?", _PROMPT_RE, timeout=5.0)
             # Parse: output should be just a number between the echo and prompt
             for line in raw.split("\n"):
                 stripped = line.strip()
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import os
+import re
 import tempfile
 
 MAX_LINES = 2000
 MAX_BYTES = 50 * 1024  # 50KB
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+
+# Code points dropped by sanitize_binary_output(): C0 controls other than
+# tab/newline/CR, DEL and the C1 controls, and the interlinear annotation
+# format chars U+FFF9..U+FFFB.
+_BINARY_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\ufff9-\ufffb]")
+
 
 def truncate_output(
     text: str,
@@ -93,9 +101,11 @@ def _save_to_temp(text: str) -> str:
 
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape sequences from text."""
-    import re
-
-    return re.sub(r"\x1b\[[0-9;]*[a-zA-Z]", "", text)
+    # Most output (TERM=dumb sessions, plain files) has no ESC at all; the
+    # substring check is a memchr and skips the regex pass entirely.
+    if "\x1b" not in text:
+        return text
+    return _ANSI_RE.sub("", text)
 
 
 def sanitize_binary_output(text: str) -> str:
@@ -104,14 +114,4 @@ def sanitize_binary_output(text: str) -> str:
     Keeps printable chars, tabs, newlines, and carriage returns.
     Strips everything else (control chars, undefined code points, format chars).
     """
-    cleaned = []
-    for ch in text:
-        cp = ord(ch)
-        # Keep: printable, tab, newline, carriage return
-        if ch in ("\t", "\n", "\r"):
-            cleaned.append(ch)
-        elif cp >= 32 and cp not in range(0x7F, 0xA0):
-            # Skip C0 controls (except above), C1 controls, and format chars
-            if cp not in range(0xFFF9, 0xFFFC):
-                cleaned.append(ch)
-    return "".join(cleaned)
+    return _BINARY_RE.sub("", text)
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+
+import pytest
+
 from reagent.pty.buffer import RollingBuffer
 
 
@@ -38,6 +42,32 @@ class TestRollingBufferBasics:
         buf.append("c")
         assert buf.read_all() == "a\nb\nc"
 
+    def test_read_all_cached_until_changed(self) -> None:
+        buf = RollingBuffer()
+        buf.append_text("a\nb")
+        first = buf.read_all()
+        assert buf.read_all() is first
+        buf.append("c")
+        assert buf.read_all() == "a\nb\nc"
+        assert buf.search("c") == [(2, "c")]
+        buf.clear()
+        assert buf.read_all() == ""
+        assert buf.read_all_raw() == ""
+
+    def test_append_line_with_embedded_newline(self) -> None:
+        buf = RollingBuffer()
+        buf.append("a\nb")
+        buf.append_text("c\nd")
+        assert buf.line_count == 3
+        assert buf.read() == ["a\nb", "c", "d"]
+        assert buf.read_tail(2) == ["c", "d"]
+
+    def test_non_ascii_round_trip(self) -> None:
+        buf = RollingBuffer()
+        buf.append_text("café\n日本語", raw_text="\x1b[1mcafé\x1b[0m\n日本語")
+        assert buf.read() == ["café", "日本語"]
+        assert buf.read_raw(0, 1) == ["\x1b[1mcafé\x1b[0m"]
+
 
 class TestRollingBufferOverflow:
     def test_maxlen_enforced(self) -> None:
@@ -60,6 +90,14 @@ class TestRollingBufferOverflow:
         assert "a" not in lines
         assert lines == ["b", "c", "d"]
 
+    def test_overflow_reclaims_storage(self) -> None:
+        buf = RollingBuffer(max_lines=10)
+        for i in range(10_000):
+            buf.append_text(f"line {i}\nmore {i}")
+        assert buf.read_tail(2) == ["line 9999", "more 9999"]
+        # Evicted lines are cut from the log, not kept around forever
+        assert len(buf._lines._log) < 1_000
+
 
 class TestRollingBufferRead:
     def test_read_with_offset(self) -> None:
@@ -98,6 +136,42 @@ class TestRollingBufferRead:
         assert tail == ["a", "b"]
 
 
+class TestRollingBufferReadText:
+    @pytest.mark.parametrize(
+        ("offset", "limit"), [(0, 500), (1, 2), (2, 0), (-3, 2), (4, 10), (9, 1)]
+    )
+    def test_matches_joined_read(self, offset: int, limit: int) -> None:
+        buf = RollingBuffer(max_lines=5)
+        buf.append("multi\nline")
+        buf.append_text("é\n\nx\ny\nz")
+        assert buf.read_text(offset, limit) == "\n".join(buf.read(offset, limit))
+
+    def test_empty(self) -> None:
+        assert RollingBuffer().read_text() == ""
+
+
+class TestRollingBufferIterFrom:
+    def test_iter_from_offset(self) -> None:
+        buf = RollingBuffer()
+        buf.append_text("a\nb\nc")
+        assert list(buf.iter_from(1)) == ["b", "c"]
+        assert list(buf.iter_from(3)) == []
+        assert list(buf.iter_from(-1)) == ["a", "b", "c"]
+
+    def test_iter_from_after_eviction(self) -> None:
+        buf = RollingBuffer(max_lines=3)
+        for i in range(10):
+            buf.append_text(f"line {i}\né{i}")
+        assert list(buf.iter_from(1)) == ["line 9", "é9"]
+
+    def test_iter_from_is_a_snapshot(self) -> None:
+        buf = RollingBuffer()
+        buf.append("a\nb")
+        it = buf.iter_from(0)
+        buf.append("c")
+        assert list(it) == ["a\nb"]
+
+
 class TestRollingBufferSearch:
     def test_search_basic(self) -> None:
         buf = RollingBuffer()
@@ -136,6 +210,34 @@ class TestRollingBufferSearch:
         results = buf.search("match", limit=3)
         assert len(results) == 3
 
+    def test_search_reports_each_line_once(self) -> None:
+        buf = RollingBuffer()
+        buf.append("aaa")
+        buf.append("b")
+        buf.append("a")
+        assert buf.search("a") == [(0, "aaa"), (2, "a")]
+
+    def test_search_anchored_pattern(self) -> None:
+        buf = RollingBuffer()
+        buf.append("(gdb) ")
+        buf.append("x (gdb) y")
+        assert buf.search(r"^\(gdb\)") == [(0, "(gdb) ")]
+
+    def test_search_never_spans_lines(self) -> None:
+        buf = RollingBuffer()
+        buf.append("ab")
+        buf.append("cd")
+        assert buf.search("[a-d]+d") == [(1, "cd")]
+        assert buf.search(r"b\s*c") == []
+
+    def test_search_numbers_lines_after_eviction(self) -> None:
+        buf = RollingBuffer(max_lines=4)
+        buf.append_text("hit 0\nmiss\nhit 2\nmiss\nhit 4\nhit 5")
+        assert buf.search("hit") == [(0, "hit 2"), (2, "hit 4"), (3, "hit 5")]
+
+    def test_search_empty_buffer(self) -> None:
+        assert RollingBuffer().search("") == []
+
 
 class TestRollingBufferClear:
     def test_clear(self) -> None:
@@ -146,3 +248,60 @@ class TestRollingBufferClear:
         assert buf.line_count == 0
         assert buf.total_lines == 0
         assert buf.read_all() == ""
+
+
+
+class TestRollingBufferNotify:
+    async def test_append_on_loop_thread_sets_event(self) -> None:
+        buf = RollingBuffer()
+        buf.attach_loop()
+        buf.append("x")
+        assert await buf.wait_for_data(timeout=0.01) is True
+        assert await buf.wait_for_data(timeout=0.01) is False
+
+    async def test_append_from_other_thread_wakes_waiter(self) -> None:
+        buf = RollingBuffer()
+        buf.attach_loop()
+        threading.Thread(target=buf.append_text, args=("a\nb",)).start()
+        assert await buf.wait_for_data(timeout=1.0) is True
+        assert buf.read() == ["a", "b"]
+
+    async def test_cross_thread_wakeups_coalesced(self) -> None:
+        buf = RollingBuffer()
+        buf.attach_loop()
+        scheduled: list[object] = []
+        real = buf._loop.call_soon_threadsafe
+
+        def spy(cb):
+            scheduled.append(cb)
+            return real(cb)
+
+        buf._loop.call_soon_threadsafe = spy  # type: ignore[method-assign]
+
+        def burst() -> None:
+            for i in range(5):
+                buf.append(f"line {i}")
+
+        t = threading.Thread(target=burst)
+        t.start()
+        t.join()
+        assert len(scheduled) == 1
+        assert await buf.wait_for_data(timeout=1.0) is True
+
+    async def test_wait_since_returns_for_missed_change(self) -> None:
+        buf = RollingBuffer()
+        buf.attach_loop()
+        seen = buf.version
+        buf.append("x")
+        # A stale set() would otherwise be cleared by the previous waiter
+        assert await buf.wait_for_data(timeout=0.01) is True
+        assert await buf.wait_for_data(timeout=0.01, since=seen) is True
+        assert await buf.wait_for_data(timeout=0.01, since=buf.version) is False
+
+    def test_version_bumped_by_every_change(self) -> None:
+        buf = RollingBuffer()
+        v0 = buf.version
+        buf.append("a")
+        buf.append_text("b\nc")
+        buf.clear()
+        assert buf.version == v0 + 3
@@ -2,9 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import enum
-
-from reagent.re.debugger import DebuggerType, _CMD_MAP, _PROMPT_PATTERNS, _xml_wrap
+import os
+import re
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from reagent.re.debugger import (
+    DebuggerType,
+    DebugSessionInfo,
+    DebugSessionRegistry,
+    DebugSessionsParams,
+    DebugSessionsTool,
+    create_debugger_tools,
+    _CMD_FN,
+    _BP_DISPATCH,
+    _CMD_MAP,
+    _PROMPT_PATTERNS,
+    _PROMPTS,
+    _debugger_argv,
+    _detect_debugger,
+    _echo_filter,
+    _location_kind,
+    _render_command,
+    _resolve_binary,
+    _xml_wrap,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -65,17 +91,17 @@ class TestPromptPatterns:
         for key in _PROMPT_PATTERNS:
             assert isinstance(key, DebuggerType)
 
-    def test_gdb_pattern(self) -> None:
-        import re
+    def test_precompiled(self) -> None:
+        for pattern in _PROMPT_PATTERNS.values():
+            assert isinstance(pattern, re.Pattern)
 
-        pattern = re.compile(_PROMPT_PATTERNS[DebuggerType.GDB])
+    def test_gdb_pattern(self) -> None:
+        pattern = _PROMPT_PATTERNS[DebuggerType.GDB]
         assert pattern.search("(gdb) ")
         assert not pattern.search("(lldb) ")
 
     def test_lldb_pattern(self) -> None:
-        import re
-
-        pattern = re.compile(_PROMPT_PATTERNS[DebuggerType.LLDB])
+        pattern = _PROMPT_PATTERNS[DebuggerType.LLDB]
         assert pattern.search("(lldb) ")
         assert not pattern.search("(gdb) ")
 
@@ -124,6 +150,58 @@ class TestCmdMap:
         assert result == "breakpoint set --name main"
 
 
+class TestBreakpointDispatch:
+    @pytest.mark.parametrize(
+        ("location", "kind"),
+        [("0x401000", "addr"), ("main.c:42", "fileline"), ("main", "name")],
+    )
+    def test_location_kind(self, location: str, kind: str) -> None:
+        assert _location_kind(location) == kind
+
+    def test_targets_exist_in_cmd_map(self) -> None:
+        for (dbg, _), name in _BP_DISPATCH.items():
+            assert name in _CMD_MAP[dbg]
+
+    def test_lldb_fileline_template(self) -> None:
+        template = _CMD_MAP[DebuggerType.LLDB]["breakpoint_fileline"]
+        assert template.format(file="main.c", line="42") == (
+            "breakpoint set --file main.c --line 42"
+        )
+
+
+class TestCmdFn:
+    def test_covers_cmd_map(self) -> None:
+        assert len(_CMD_FN) == sum(len(cmds) for cmds in _CMD_MAP.values())
+
+    @pytest.mark.parametrize("dbg", list(DebuggerType))
+    def test_matches_template_format(self, dbg: DebuggerType) -> None:
+        params = {
+            "location": "main",
+            "address": "0x401000",
+            "number": "1",
+            "count": "4",
+            "format": "x",
+            "expression": "$rax",
+            "file": "main.c",
+            "line": "42",
+        }
+        for name, template in _CMD_MAP[dbg].items():
+            assert _CMD_FN[(dbg, name)](params) == template.format(**params)
+            assert _CMD_FN[(dbg, name)](None) == template
+
+    def test_plain_string_key(self) -> None:
+        assert _CMD_FN[("gdb", "step_over")](None) == "next"
+
+    def test_render_command(self) -> None:
+        assert _render_command(DebuggerType.LLDB, "print", {"expression": "x"}) == (
+            "expression -- x"
+        )
+
+    def test_render_unknown_command_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown abstract command"):
+            _render_command(DebuggerType.GDB, "breakpoint_addr")
+
+
 # ---------------------------------------------------------------------------
 # _xml_wrap
 # ---------------------------------------------------------------------------
@@ -142,6 +220,12 @@ class TestXmlWrap:
         assert result.endswith("</debug_output>")
         assert "\ndata\n" in result
 
+    def test_attribute_values_escaped(self) -> None:
+        result = _xml_wrap("debug_output", "x", command='print "a<b" & c')
+        assert result.startswith(
+            '<debug_output command="print &quot;a&lt;b&quot; &amp; c">'
+        )
+
     def test_empty_content(self) -> None:
         result = _xml_wrap("empty", "")
         assert result == "<empty>\n\n</empty>"
@@ -150,3 +234,193 @@ class TestXmlWrap:
         content = "line1\nline2\nline3"
         result = _xml_wrap("output", content)
         assert f"<output>\n{content}\n</output>" == result
+
+
+# ---------------------------------------------------------------------------
+# _detect_debugger
+# ---------------------------------------------------------------------------
+
+
+class TestDetectDebugger:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        _detect_debugger.cache_clear()
+        yield
+        _detect_debugger.cache_clear()
+
+    def test_path_scanned_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+
+        def fake_which(name: str) -> str | None:
+            calls.append(name)
+            return "/usr/bin/gdb" if name == "gdb" else None
+
+        monkeypatch.setattr(shutil, "which", fake_which)
+        first = _detect_debugger()
+        probes = len(calls)
+        assert _detect_debugger() == first
+        assert len(calls) == probes
+
+    def test_none_when_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+        assert _detect_debugger() is None
+
+
+# ---------------------------------------------------------------------------
+# _echo_filter
+# ---------------------------------------------------------------------------
+
+
+def _clean_by_line(output: str, command: str, dbg: DebuggerType) -> str:
+    """Reference per-line cleanup the regex replaces."""
+    pattern = _PROMPT_PATTERNS[dbg]
+    kept = [
+        line
+        for line in output.split("\n")
+        if line.strip() != command.strip() and not pattern.fullmatch(line.strip())
+    ]
+    return "\n".join(kept).strip()
+
+
+class TestEchoFilter:
+    def test_drops_echo_and_prompt_lines(self) -> None:
+        output = "info registers\r\nrax 0x1\r\nrbx 0x2\r\n(gdb) "
+        echo = _echo_filter(_PROMPTS[DebuggerType.GDB], "info registers")
+        assert echo.sub("", output).strip() == "rax 0x1\r\nrbx 0x2"
+
+    def test_keeps_prompt_with_other_text(self) -> None:
+        echo = _echo_filter(_PROMPTS[DebuggerType.GDB], "next")
+        assert echo.sub("", "(gdb) next\n").strip() == "(gdb) next"
+
+    def test_command_is_escaped(self) -> None:
+        echo = _echo_filter(_PROMPTS[DebuggerType.GDB], "print (a+b)*2")
+        assert echo.sub("", "print (a+b)*2\n$1 = 6\n").strip() == "$1 = 6"
+
+    @pytest.mark.parametrize("dbg", list(DebuggerType))
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "",
+            "bt\r\n#0 main ()\r\n\r\n  bt  \r\n",
+            "\n\n(gdb)\n\n(lldb) \nx\n",
+            "  (gdb)  \r\nbt\n#1\n(lldb)",
+            "a\n\n\nb\n",
+        ],
+    )
+    @pytest.mark.parametrize("command", ["bt", "  bt ", ""])
+    def test_matches_per_line_cleanup(
+        self, dbg: DebuggerType, output: str, command: str
+    ) -> None:
+        echo = _echo_filter(_PROMPTS[dbg], command)
+        assert echo.sub("", output).strip() == _clean_by_line(output, command, dbg)
+
+
+# ---------------------------------------------------------------------------
+# _resolve_binary
+# ---------------------------------------------------------------------------
+
+
+class TestResolveBinary:
+    def test_relative_to_agent_cwd(self, tmp_path) -> None:
+        (tmp_path / "a.out").touch()
+        assert _resolve_binary(str(tmp_path), "a.out") == str(tmp_path / "a.out")
+
+    def test_falls_back_to_process_cwd(self, tmp_path, monkeypatch) -> None:
+        (tmp_path / "a.out").touch()
+        monkeypatch.chdir(tmp_path)
+        assert _resolve_binary(os.path.join(str(tmp_path), "sub"), "a.out") == str(
+            tmp_path / "a.out"
+        )
+
+    def test_missing(self, tmp_path) -> None:
+        assert _resolve_binary(str(tmp_path), "a.out") is None
+
+    def test_directory_is_not_a_binary(self, tmp_path) -> None:
+        (tmp_path / "bin").mkdir()
+        assert _resolve_binary(str(tmp_path), "bin") is None
+
+
+# ---------------------------------------------------------------------------
+# _debugger_argv
+# ---------------------------------------------------------------------------
+
+
+class TestDebuggerArgv:
+    def test_gdb_without_args(self) -> None:
+        argv = _debugger_argv(DebuggerType.GDB, "/bin/a")
+        assert argv == ["gdb", "-q", "--nx", "/bin/a"]
+
+    def test_gdb_args_set_at_startup(self) -> None:
+        argv = _debugger_argv(DebuggerType.GDB, "/bin/a", ["-v", "in.txt"])
+        assert argv == ["gdb", "-q", "--nx", "-ex", "set args -v in.txt", "/bin/a"]
+
+    def test_lldb_args_set_at_startup(self) -> None:
+        argv = _debugger_argv(DebuggerType.LLDB, "/bin/a", ["-v"])
+        assert argv == [
+            "lldb",
+            "--no-use-colors",
+            "-o",
+            "settings set target.run-args -v",
+            "/bin/a",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# DebugSessionsTool
+# ---------------------------------------------------------------------------
+
+
+class TestDebugSessionsTool:
+    def _registry(self, *alive: bool) -> DebugSessionRegistry:
+        registry = DebugSessionRegistry(pty_manager=None)  # type: ignore[arg-type]
+        for i, is_alive in enumerate(alive):
+            sid = f"sess{i}"
+            registry._sessions[sid] = DebugSessionInfo(
+                session_id=sid,
+                pty_session=SimpleNamespace(alive=is_alive),  # type: ignore[arg-type]
+                debugger_type=DebuggerType.GDB,
+                binary_path=f"/tmp/bin{i}",
+                prompt_pattern=_PROMPT_PATTERNS[DebuggerType.GDB],
+            )
+        return registry
+
+    def _run(self, registry: DebugSessionRegistry):
+        tool = DebugSessionsTool(registry)
+        return asyncio.run(tool.execute(DebugSessionsParams()))
+
+    def test_empty(self) -> None:
+        result = self._run(self._registry())
+        assert 'count="0"' in result.output
+        assert "No active debug sessions" in result.output
+
+    def test_table(self) -> None:
+        result = self._run(self._registry(True, False))
+        assert 'count="2"' in result.output
+        assert "sess0        gdb      yes    /tmp/bin0" in result.output
+        assert "sess1        gdb      no     /tmp/bin1" in result.output
+        assert result.brief == "2 debug session(s)"
+
+    def test_list_sessions_matches_iter(self) -> None:
+        registry = self._registry(True)
+        assert [s["id"] for s in registry.list_sessions()] == [
+            info.session_id for info in registry.iter_sessions()
+        ]
+
+
+class TestCreateDebuggerTools:
+    def test_tools_share_registry(self) -> None:
+        registry, tools = create_debugger_tools(None, cwd="/tmp")  # type: ignore[arg-type]
+        assert [t.name for t in tools] == [
+            "debug_launch",
+            "debug_breakpoint",
+            "debug_continue",
+            "debug_registers",
+            "debug_memory",
+            "debug_backtrace",
+            "debug_eval",
+            "debug_kill",
+            "debug_sessions",
+        ]
+        assert all(t._registry is registry for t in tools)
+        assert tools[0]._cwd == "/tmp"
+
@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from reagent.re.file_info import ELFSecurityInfo
+import asyncio
+import json
+import os
+import struct
+import sys
+from types import SimpleNamespace
+
+import lief
+import pytest
+
+from reagent.re import file_info
+from reagent.re.file_info import ELFSecurityInfo, FileInfoParams, FileInfoTool
 
 
 # ---------------------------------------------------------------------------
@@ -58,3 +69,293 @@ class TestELFSecurityInfo:
         info2 = ELFSecurityInfo()
         info1.fortified.append("__printf_chk")
         assert info2.fortified == []
+
+
+# ---------------------------------------------------------------------------
+# _detect_elf_security
+# ---------------------------------------------------------------------------
+
+
+def _fake_elf(segments, symbols, dynamic=()):
+    segs = [SimpleNamespace(type=t, flags=f) for t, f in segments]
+    return SimpleNamespace(
+        is_pie=True,
+        # Binary.get(type): first segment of that type, or None
+        get=lambda seg_type: next((s for s in segs if s.type == seg_type), None),
+        imported_symbols=[SimpleNamespace(name=n) for n in symbols],
+        dynamic_entries=list(dynamic),
+    )
+
+
+class TestDetectElfSecurity:
+    SEG = lief.ELF.Segment
+
+    def test_relro_before_stack(self) -> None:
+        binary = _fake_elf(
+            [
+                (self.SEG.TYPE.GNU_RELRO, self.SEG.FLAGS.R),
+                (self.SEG.TYPE.GNU_STACK, self.SEG.FLAGS.R | self.SEG.FLAGS.W),
+            ],
+            [],
+        )
+        info = file_info._detect_elf_security(binary)
+        assert info.has_relro
+        assert info.nx
+
+    def test_executable_stack(self) -> None:
+        binary = _fake_elf(
+            [(self.SEG.TYPE.GNU_STACK, self.SEG.FLAGS.R | self.SEG.FLAGS.X)], []
+        )
+        info = file_info._detect_elf_security(binary)
+        assert not info.nx
+        assert not info.has_relro
+
+    def test_first_stack_segment_wins(self) -> None:
+        binary = _fake_elf(
+            [
+                (self.SEG.TYPE.GNU_STACK, self.SEG.FLAGS.R | self.SEG.FLAGS.W),
+                (self.SEG.TYPE.GNU_STACK, self.SEG.FLAGS.R | self.SEG.FLAGS.X),
+            ],
+            [],
+        )
+        assert file_info._detect_elf_security(binary).nx
+
+    def test_no_stack_segment(self) -> None:
+        info = file_info._detect_elf_security(_fake_elf([], []))
+        assert not info.nx
+
+    def test_canary_and_fortify_in_one_pass(self) -> None:
+        binary = _fake_elf(
+            [], ["puts", "__stack_chk_fail", "__printf_chk", "__memcpy_chk"]
+        )
+        info = file_info._detect_elf_security(binary)
+        assert info.canary
+        assert info.fortified == ["__printf_chk", "__memcpy_chk"]
+
+    def test_canary_name_is_not_fortify(self) -> None:
+        binary = _fake_elf([], ["__stack_chk_guard", "__chk_fail", "chk"])
+        info = file_info._detect_elf_security(binary)
+        assert info.canary
+        assert info.fortified == []
+
+
+# ---------------------------------------------------------------------------
+# _append_symbols
+# ---------------------------------------------------------------------------
+
+
+class _CountingSymbols:
+    """Sized iterable that records how many items were pulled."""
+
+    def __init__(self, n: int) -> None:
+        self._items = [SimpleNamespace(name=f"sym{i}") for i in range(n)]
+        self.pulled = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        for item in self._items:
+            self.pulled += 1
+            yield item
+
+
+class TestAppendSymbols:
+    def test_caps_listing_without_materialising_rest(self) -> None:
+        symbols = _CountingSymbols(1000)
+        lines: list[str] = []
+        file_info._append_symbols(lines, "Exported Symbols", symbols)
+        assert lines[1] == "== Exported Symbols (1000) =="
+        assert lines[-1] == "  ... and 950 more"
+        assert len(lines) == 2 + 50 + 1
+        assert symbols.pulled == 50
+
+    def test_short_listing(self) -> None:
+        lines: list[str] = []
+        file_info._append_symbols(lines, "Imported Symbols", _CountingSymbols(2))
+        assert lines == ["", "== Imported Symbols (2) ==", "  sym0", "  sym1"]
+
+    def test_empty_adds_nothing(self) -> None:
+        lines: list[str] = []
+        file_info._append_symbols(lines, "Imported Symbols", _CountingSymbols(0))
+        assert lines == []
+
+
+# ---------------------------------------------------------------------------
+# _name
+# ---------------------------------------------------------------------------
+
+
+class TestEnumName:
+    def test_lief_enum(self) -> None:
+        assert file_info._name(lief.ELF.Segment.TYPE.GNU_STACK) == "GNU_STACK"
+
+    def test_falls_back_to_str(self) -> None:
+        class Unnamed:
+            name = None
+
+            def __str__(self) -> str:
+                return "FLAGS.R|X"
+
+        assert file_info._name(Unnamed()) == "R|X"
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+class TestInspectCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        file_info._inspect.cache_clear()
+        yield
+        file_info._inspect.cache_clear()
+
+    @pytest.fixture
+    def parses(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+
+        def fake_parse(path: str) -> object:
+            calls.append(path)
+            return SimpleNamespace(format=lief.Binary.FORMATS.UNKNOWN)
+
+        monkeypatch.setattr(file_info, "_parse", fake_parse)
+        monkeypatch.setattr(
+            FileInfoTool, "_describe", staticmethod(lambda binary, fmt, sec, entropy: "report")
+        )
+        monkeypatch.setattr(
+            FileInfoTool, "_target_fields", staticmethod(lambda binary, fmt, sec: {})
+        )
+        return calls
+
+    def _run(self, path: str):
+        tool = FileInfoTool()
+        return asyncio.run(tool.execute(FileInfoParams(path=path)))
+
+    def test_unchanged_file_parsed_once(self, tmp_path, parses) -> None:
+        binary = tmp_path / "a.out"
+        binary.write_bytes(b"\x7fELF")
+        assert self._run(str(binary)).output == "report"
+        assert self._run(str(binary)).output == "report"
+        assert len(parses) == 1
+
+    def test_modified_file_parsed_again(self, tmp_path, parses) -> None:
+        binary = tmp_path / "a.out"
+        binary.write_bytes(b"\x7fELF")
+        self._run(str(binary))
+        os.utime(binary, ns=(1, 1))
+        self._run(str(binary))
+        assert len(parses) == 2
+
+    def test_unparsable_not_cached(self, tmp_path) -> None:
+        text = tmp_path / "notes.txt"
+        text.write_text("not a binary")
+        result = self._run(str(text))
+        assert result.is_error
+        assert "could not parse" in result.output
+        assert file_info._inspect.cache_info().currsize == 0
+
+    def test_directory_rejected(self, tmp_path, parses) -> None:
+        result = self._run(str(tmp_path))
+        assert result.is_error
+        assert "File not found" in result.output
+        assert parses == []
+
+    def test_bad_path_falls_back_to_default(self, tmp_path, parses) -> None:
+        binary = tmp_path / "a.out"
+        binary.write_bytes(b"\x7fELF")
+        tool = FileInfoTool(binary_path=str(binary))
+        result = asyncio.run(tool.execute(FileInfoParams(path=str(tmp_path / "nope"))))
+        assert result.output == "report"
+        assert parses == [str(binary)]
+
+
+class TestParse:
+    def test_lief_warnings_silenced(self) -> None:
+        assert lief.logging.get_level() == lief.logging.LEVEL.ERROR
+
+    def test_dispatch_on_magic(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(
+            file_info,
+            "_PARSERS",
+            ((b"\x7fELF", lambda path: "elf"), (b"MZ", lambda path: "pe")),
+        )
+        elf = tmp_path / "a.out"
+        elf.write_bytes(b"\x7fELF\x02\x01")
+        exe = tmp_path / "a.exe"
+        exe.write_bytes(b"MZ\x90\x00")
+        assert file_info._parse(str(elf)) == "elf"
+        assert file_info._parse(str(exe)) == "pe"
+
+    def test_elf_parser_skips_relocations(self) -> None:
+        magic, parse = file_info._PARSERS[0]
+        assert magic == b"\x7fELF"
+        assert not parse.keywords["config"].parse_relocations
+
+    def test_short_file_rejected_without_lief(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(lief, "parse", lambda path: pytest.fail("parsed"))
+        stub = tmp_path / "stub"
+        stub.write_bytes(b"MZ")
+        assert file_info._parse(str(stub)) is None
+
+    def test_unknown_magic_uses_generic_parser(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(lief, "parse", lambda path: "generic")
+        blob = tmp_path / "blob"
+        blob.write_bytes(b"\xcf\xfa\xed\xfe")
+        assert file_info._parse(str(blob)) == "generic"
+
+
+# ---------------------------------------------------------------------------
+# Entropy column
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(not os.path.isfile("/bin/ls"), reason="needs an ELF binary")
+class TestEntropyColumn:
+    def _sections(self, **params) -> str:
+        tool = FileInfoTool()
+        result = asyncio.run(tool.execute(FileInfoParams(path="/bin/ls", **params)))
+        assert not result.is_error
+        return result.output.split("== Sections ==")[1]
+
+    def test_omitted_by_default(self) -> None:
+        assert "Entropy" not in self._sections()
+
+    def test_opt_in(self) -> None:
+        assert "Entropy" in self._sections(include_entropy=True)
+
+
+# ---------------------------------------------------------------------------
+# JSON output
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(not os.path.isfile("/bin/ls"), reason="needs an ELF binary")
+class TestJsonFormat:
+    def _run(self, **params) -> str:
+        tool = FileInfoTool()
+        result = asyncio.run(tool.execute(FileInfoParams(path="/bin/ls", **params)))
+        assert not result.is_error
+        return result.output
+
+    def test_structured_fields(self) -> None:
+        data = json.loads(self._run(format="json"))
+        assert data["format"] == "ELF"
+        assert data["sections"]
+        assert set(data["sections"][0]) == {"name", "vaddr", "size"}
+        assert data["imported_symbols"]["total"] >= len(data["imported_symbols"]["names"])
+        assert "libraries" in data
+
+    def test_header_fields_from_enums(self) -> None:
+        data = json.loads(self._run(format="json"))
+        assert data["bits"] == struct.calcsize("P") * 8
+        assert data["endian"] == sys.byteorder
+
+    def test_entropy_opt_in(self) -> None:
+        data = json.loads(self._run(format="json", include_entropy=True))
+        assert "entropy" in data["sections"][0]
+
+    def test_text_is_default(self) -> None:
+        assert self._run().startswith("Format: ELF")
+
@@ -287,3 +287,16 @@ class TestMessageToOpenAI:
         # Should include thinking blocks for providers that support them
         if "thinking_blocks" in d:
             assert len(d["thinking_blocks"]) == 1
+
+
+class TestOpenAIDictCache:
+    def test_repeated_calls_reuse_dict(self) -> None:
+        msg = Message.user("hello")
+        first = msg.to_openai_dict()
+        assert msg.to_openai_dict() is first
+
+    def test_cache_ignored_for_equality(self) -> None:
+        a = Message.user("hello")
+        b = Message.user("hello")
+        a.to_openai_dict()
+        assert a == b
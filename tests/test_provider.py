@@ -219,3 +219,11 @@ class TestChunkToDict:
         chunk = _FakeChunk(choices=[_FakeChoice(delta=_FakeDelta(content=None))])
         d = _chunk_to_dict(chunk)
         assert "content" not in d["delta"]
+
+    def test_thinking_blocks_kept(self) -> None:
+        # Gemini/Vertex stream thinking_blocks too (thought signatures)
+        delta = _FakeDelta(content="x")
+        delta.thinking_blocks = [{"thinking": "t", "signature": "s"}]
+        chunk = _FakeChunk(choices=[_FakeChoice(delta=delta)])
+        d = _chunk_to_dict(chunk, tool_calls=False)
+        assert d["delta"]["thinking_blocks"] == delta.thinking_blocks
@@ -0,0 +1,306 @@
+"""Tests for reagent.pty.session helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import os
+import re
+import shutil
+import sys
+
+import pytest
+
+from reagent.pty import session as session_mod
+from reagent.pty.session import (
+    _MAX_DRAIN,
+    PTYSession,
+    PTYStatus,
+    _base_env,
+    _line_matcher,
+)
+
+
+# ---------------------------------------------------------------------------
+# _line_matcher
+# ---------------------------------------------------------------------------
+
+
+class TestLineMatcher:
+    def test_pure_literal_skips_regex(self) -> None:
+        matches = _line_matcher(r"\(gdb\) ")
+        assert matches("(gdb) ")
+        assert matches("x (gdb) y")
+        assert not matches("(gdb)")
+
+    def test_prompt_pattern(self) -> None:
+        matches = _line_matcher(r"\(gdb\)\s*$")
+        assert matches("(gdb) ")
+        assert not matches("(gdb) x")
+        assert not matches("gdb")
+
+    def test_quantified_prefix_char_not_required(self) -> None:
+        matches = _line_matcher("ab*c")
+        assert matches("ac")
+        assert matches("abbc")
+
+    def test_alternation_disables_prefix(self) -> None:
+        matches = _line_matcher("ab|cd")
+        assert matches("cd")
+        assert not matches("ac")
+
+    def test_escaped_pipe_is_literal(self) -> None:
+        matches = _line_matcher(r"a\|b")
+        assert matches("a|b")
+        assert not matches("b")
+
+    @pytest.mark.parametrize("pattern", [r"\d+$", r"(?i)gdb", r"^\s*\w+:"])
+    def test_agrees_with_search(self, pattern: str) -> None:
+        matches = _line_matcher(pattern)
+        compiled = re.compile(pattern)
+        for line in ["", "GDB 12", "  rax: 0", "42", "x"]:
+            assert bool(matches(line)) == bool(compiled.search(line))
+
+    def test_ignorecase_flag_skips_literal_prefilter(self) -> None:
+        matches = _line_matcher("gdb", re.IGNORECASE)
+        assert matches("(GDB)")
+
+    def test_cached_per_pattern_and_flags(self) -> None:
+        assert _line_matcher("abc\\s") is _line_matcher("abc\\s")
+        assert _line_matcher("abc\\s") is not _line_matcher("abc\\s", re.IGNORECASE)
+
+    def test_invalid_pattern_raises(self) -> None:
+        with pytest.raises(re.error):
+            _line_matcher("(")
+
+
+# ---------------------------------------------------------------------------
+# _base_env
+# ---------------------------------------------------------------------------
+
+
+class TestBaseEnv:
+    def test_forces_dumb_terminal(self) -> None:
+        env = _base_env()
+        assert env["TERM"] == "dumb"
+        assert "PROMPT_COMMAND" not in env
+
+    def test_built_once(self) -> None:
+        assert _base_env() is _base_env()
+
+
+# ---------------------------------------------------------------------------
+# Output draining (_on_readable fed from a pipe)
+# ---------------------------------------------------------------------------
+
+
+class TestDrainNewlines:
+    @pytest.fixture
+    def feed(self):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        if hasattr(fcntl, "F_SETPIPE_SZ"):
+            # Room for a whole _MAX_DRAIN burst in one write
+            fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, 2 * _MAX_DRAIN)
+        loop = asyncio.new_event_loop()
+        session = PTYSession(command=["true"])
+        session._master_fd = read_fd
+        session._loop = loop
+
+        def feed(data: bytes) -> list[str]:
+            os.write(write_fd, data)
+            session._on_readable()
+            # Run anything the drain scheduled
+            loop.run_until_complete(asyncio.sleep(0))
+            return session.buffer.read(limit=session.buffer.line_count)
+
+        yield feed
+        loop.close()
+        # Never started, so still RUNNING: keep __del__ from closing the fd
+        # number after it has been reused
+        session._master_fd = -1
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def test_final_newline_adds_no_line(self, feed) -> None:
+        assert feed(b"a\nb\n") == ["a", "b"]
+
+    def test_lone_newline_after_line_is_blank_line(self, feed) -> None:
+        feed(b"a\n")
+        assert feed(b"\n") == ["a", ""]
+        assert feed(b"b\n") == ["a", "", "b"]
+
+    def test_newline_ending_partial_line_adds_nothing(self, feed) -> None:
+        feed(b"(gdb) ")
+        assert feed(b"\n") == ["(gdb) "]
+        assert feed(b"\nnext\n") == ["(gdb) ", "", "next"]
+
+    @pytest.mark.skipif(not hasattr(fcntl, "F_SETPIPE_SZ"), reason="Linux pipes")
+    def test_full_drain_ending_in_prompt_delivers_prompt(self, feed) -> None:
+        prompt = b"(gdb) "
+        line = b"x" * 1023 + b"\n"
+        body = line * (_MAX_DRAIN // len(line) - 1)
+        body += b"y" * (_MAX_DRAIN - len(body) - len(prompt) - 1) + b"\n"
+        assert len(body + prompt) == _MAX_DRAIN
+        assert feed(body + prompt)[-1] == "(gdb) "
+
+
+class TestBlockedWrite:
+    def test_write_after_eof_raises_cleanly(self) -> None:
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        try:
+            # Fill the pipe so the write has to wait for the fd
+            with pytest.raises(BlockingIOError):
+                while True:
+                    os.write(write_fd, b"x" * 65536)
+            session = PTYSession(command=["true"])
+            session._master_fd = write_fd  # _loop is None, as after EOF
+            with pytest.raises(RuntimeError, match="closed while writing"):
+                asyncio.run(session.write("quit"))
+            session._master_fd = -1  # see TestDrainNewlines.feed
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+class TestWriteBatching:
+    async def test_cancelled_first_sender_keeps_batch(self) -> None:
+        read_fd, write_fd = os.pipe()
+        session = PTYSession(command=["true"])
+        session._master_fd = write_fd
+        try:
+            async with session._write_lock:  # an earlier batch still writing
+                first = asyncio.create_task(session.write("one"))
+                second = asyncio.create_task(session.write("two"))
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                first.cancel()
+                await asyncio.sleep(0)
+            await asyncio.wait_for(second, timeout=5.0)
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            assert os.read(read_fd, 100) == b"one\ntwo\n"
+        finally:
+            session._master_fd = -1  # see TestDrainNewlines.feed
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+# ---------------------------------------------------------------------------
+# PTYSession driving real children
+# ---------------------------------------------------------------------------
+
+_PS1 = "PROMPT> "
+_PROMPT_RE = r"PROMPT> $"
+
+
+async def _wait_for_line(session: PTYSession, pattern: str, timeout: float = 5.0) -> None:
+    """Wait until some buffered line matches ``pattern``."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        version = session.buffer.version
+        if any(re.search(pattern, line) for line in session.buffer.iter_from(0)):
+            return
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise AssertionError(f"{pattern!r} never appeared")
+        await session.buffer.wait_for_data(timeout=remaining, since=version)
+
+
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+class TestPTYSessionIntegration:
+    @pytest.fixture
+    async def shell(self):
+        session = PTYSession(command=["sh", "-i"], env={"PS1": _PS1})
+        await session.start()
+        await _wait_for_line(session, _PROMPT_RE)
+        yield session
+        session.kill()
+
+    async def test_send(self, shell: PTYSession) -> None:
+        output = await shell.send("echo hello-$((6 * 7))", timeout=5.0)
+        assert "hello-42" in output
+
+    async def test_send_and_match(self, shell: PTYSession) -> None:
+        output = await shell.send_and_match("echo marker", _PROMPT_RE, timeout=5.0)
+        assert "marker" in output
+        assert output.endswith(_PS1)
+
+    async def test_concurrent_writes_coalesced(
+        self, shell: PTYSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[list[bytes]] = []
+        real_writev = os.writev
+
+        def spy(fd: int, iov: list[bytes]) -> int:
+            calls.append(list(iov))
+            return real_writev(fd, iov)
+
+        monkeypatch.setattr(session_mod.os, "writev", spy)
+        await asyncio.gather(*(shell.write(f"echo out-{i}") for i in range(3)))
+        assert len(calls) == 1
+        assert b"".join(calls[0]) == b"echo out-0\necho out-1\necho out-2\n"
+        # Output lines may follow a prompt; echoed input starts with "echo"
+        output_re = re.compile(r"^(?:PROMPT> )*(out-\d)\s*$")
+        await _wait_for_line(shell, r"^(?:PROMPT> )*out-2\s*$")
+        outputs = [
+            m.group(1)
+            for line in shell.buffer.iter_from(0)
+            if (m := output_re.match(line))
+        ]
+        assert outputs == ["out-0", "out-1", "out-2"]
+
+    async def test_aclose(self, shell: PTYSession) -> None:
+        code = await shell.aclose(timeout=5.0)
+        assert code is not None
+        assert shell.status == PTYStatus.KILLED
+        assert not shell.alive
+        with pytest.raises(RuntimeError):
+            await shell.write("echo too-late")
+
+    async def test_kill(self, shell: PTYSession) -> None:
+        shell.kill()
+        assert shell.status == PTYStatus.KILLED
+        assert await shell.wait_for_exit(timeout=5.0) is not None
+
+    async def test_on_exit_gets_exit_code(self) -> None:
+        for _ in range(3):
+            exited: asyncio.Future[int | None] = (
+                asyncio.get_running_loop().create_future()
+            )
+            session = PTYSession(command=["sh", "-c", "exit 3"])
+            session.set_on_exit(lambda s, code: exited.set_result(code))
+            await session.start()
+            assert await asyncio.wait_for(exited, timeout=5.0) == 3
+            assert session.status == PTYStatus.EXITED
+            session.kill()
+
+    async def test_wait_for_exit_after_reap(self) -> None:
+        session = PTYSession(command=["sh", "-c", "exit 3"])
+        await session.start()
+        assert session._proc is not None
+        await session._proc.wait()  # reaped before wait_for_exit is called
+        assert await session.wait_for_exit(timeout=0) == 3
+        session.kill()
+
+    async def test_large_burst_ending_in_prompt(self) -> None:
+        # One write of well over _MAX_DRAIN that ends in a prompt with no
+        # newline; the prompt must reach the buffer without further input.
+        script = (
+            "import sys\n"
+            "sys.stdin.readline()\n"
+            f"sys.stdout.write(('x' * 1023 + '\\n') * {2 * _MAX_DRAIN // 1024} + '(py) ')\n"
+            "sys.stdout.flush()\n"
+            "sys.stdin.readline()\n"
+        )
+        session = PTYSession(command=[sys.executable, "-c", script])
+        await session.start()
+        try:
+            output = await session.send_and_match("go", r"\(py\) $", timeout=10.0)
+            assert output.endswith("(py) ")
+            assert output.count("x") == 1023 * (2 * _MAX_DRAIN // 1024)
+        finally:
+            session.kill()
+
@@ -1,9 +1,21 @@
-"""Tests for reagent.llm.streaming (StepResult, GenerateResult)."""
+"""Tests for reagent.llm.streaming (StepResult, GenerateResult, batching)."""
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 from reagent.llm.message import Message, TextPart, ToolCallPart
-from reagent.llm.streaming import GenerateResult, StepResult
+from reagent.llm.provider import ProviderConfig
+from reagent.llm.streaming import (
+    GenerateResult,
+    StepResult,
+    _BATCH_MAX_CHARS,
+    _BATCH_MAX_DELAY,
+    _TextBatcher,
+    generate,
+    step,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -74,3 +86,173 @@ class TestStepResultStopReason:
         msg = Message(role="assistant", parts=[])
         result = StepResult(message=msg, finish_reason="length")
         assert result.stop_reason == "context_overflow"
+
+
+# ---------------------------------------------------------------------------
+# _TextBatcher / generate() callback coalescing
+# ---------------------------------------------------------------------------
+
+
+class _FakeProvider:
+    def __init__(self, chunks: list[dict[str, Any]]) -> None:
+        self._chunks = chunks
+
+    @property
+    def config(self) -> ProviderConfig:
+        return ProviderConfig(model="test/model")
+
+    async def stream(self, system, messages, tools=None):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _SlowProvider(_FakeProvider):
+    """Stalls after every chunk, like a provider pausing mid-answer."""
+
+    def __init__(self, chunks: list[dict[str, Any]], delay: float) -> None:
+        super().__init__(chunks)
+        self._delay = delay
+        self.seen_during_stall: list[list[str]] = []
+        self.parts: list[str] = []
+
+    async def stream(self, system, messages, tools=None):
+        for chunk in self._chunks:
+            yield chunk
+            await asyncio.sleep(self._delay)
+            self.seen_during_stall.append(list(self.parts))
+
+
+class TestTextBatcher:
+    def test_buffers_small_fragments(self) -> None:
+        emitted: list[str] = []
+        batcher = _TextBatcher(emitted.append)
+        assert batcher.add("a") is False
+        assert batcher.add("b") is False
+        assert emitted == []
+        assert batcher.flush() is True
+        assert emitted == ["ab"]
+
+    def test_flushes_on_size(self) -> None:
+        emitted: list[str] = []
+        batcher = _TextBatcher(emitted.append)
+        assert batcher.add("x" * _BATCH_MAX_CHARS) is True
+        assert emitted == ["x" * _BATCH_MAX_CHARS]
+
+    def test_flush_empty_is_noop(self) -> None:
+        emitted: list[str] = []
+        batcher = _TextBatcher(emitted.append)
+        assert batcher.flush() is False
+        assert emitted == []
+
+
+class TestGenerateBatching:
+    async def test_text_fragments_coalesced(self) -> None:
+        chunks = [{"delta": {"content": c}} for c in ("Hel", "lo", " world")]
+        parts: list[Any] = []
+        result = await generate(
+            _FakeProvider(chunks), "sys", [], on_part=parts.append
+        )
+        assert [p.text for p in parts] == ["Hello world"]
+        assert result.message.text == "Hello world"
+
+    async def test_stalled_stream_flushes_on_timer(self) -> None:
+        provider = _SlowProvider(
+            [{"delta": {"content": "Hel"}}, {"delta": {"content": "lo"}}],
+            delay=_BATCH_MAX_DELAY * 5,
+        )
+        await generate(
+            provider, "sys", [], on_part=lambda p: provider.parts.append(p.text)
+        )
+        # "Hel" reached the callback while the provider was still stalled
+        assert provider.seen_during_stall[0] == ["Hel"]
+        assert provider.parts == ["Hel", "lo"]
+
+    async def test_thinking_emitted_before_text(self) -> None:
+        chunks = [
+            {"delta": {"reasoning_content": "hmm"}},
+            {"delta": {"content": "answer"}},
+        ]
+        events: list[tuple[str, str]] = []
+        await generate(
+            _FakeProvider(chunks),
+            "sys",
+            [],
+            on_part=lambda p: events.append(("text", p.text)),
+            on_thinking=lambda t: events.append(("thinking", t)),
+        )
+        assert events == [("thinking", "hmm"), ("text", "answer")]
+
+    async def test_thinking_blocks_keep_stream_order(self) -> None:
+        chunks = [
+            {"delta": {"content": "first"}},
+            {"delta": {"thinking_blocks": [{"thinking": "hmm", "signature": "s"}]}},
+            {"delta": {"content": "second"}},
+        ]
+        events: list[tuple[str, str]] = []
+        await generate(
+            _FakeProvider(chunks),
+            "sys",
+            [],
+            on_part=lambda p: events.append(("text", p.text)),
+            on_thinking=lambda t: events.append(("thinking", t)),
+        )
+        assert events == [("text", "first"), ("thinking", "hmm"), ("text", "second")]
+
+
+class TestStepToolDispatch:
+    @staticmethod
+    def _tool_call_chunks(*names: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": i,
+                            "id": f"tc{i}",
+                            "function": {"name": name, "arguments": "{}"},
+                        }
+                    ]
+                }
+            }
+            for i, name in enumerate(names)
+        ]
+
+    async def test_results_in_call_order_reported_on_completion(self) -> None:
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def dispatch(tc):
+            await asyncio.sleep(delays[tc.name])
+            return tc.name, False
+
+        done: list[str] = []
+        result = await step(
+            _FakeProvider(self._tool_call_chunks("slow", "fast")),
+            "sys",
+            [],
+            tool_dispatch=dispatch,
+            on_tool_done=lambda msg: done.append(msg.parts[0].tool_call_id),
+        )
+        assert [m.parts[0].tool_call_id for m in result.tool_results] == ["tc0", "tc1"]
+        assert done == ["tc1", "tc0"]
+
+    async def test_max_concurrent_tools(self) -> None:
+        running = 0
+        peak = 0
+
+        async def dispatch(tc):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok", False
+
+        result = await step(
+            _FakeProvider(self._tool_call_chunks("a", "b", "c", "d")),
+            "sys",
+            [],
+            tool_dispatch=dispatch,
+            max_concurrent_tools=2,
+        )
+        assert len(result.tool_results) == 4
+        assert peak == 2
@@ -89,6 +89,10 @@ class TestStripAnsi:
     def test_no_ansi(self) -> None:
         assert strip_ansi("hello world") == "hello world"
 
+    def test_no_escape_returns_same_object(self) -> None:
+        text = "plain output\nwith [brackets] and ;semicolons;"
+        assert strip_ansi(text) is text
+
     def test_color_codes(self) -> None:
         assert strip_ansi("\x1b[31mred\x1b[0m") == "red"
 